@@ -1,22 +1,25 @@
 """Per-file analysis for Revibe scanner."""
 
+import re
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Optional
 
-from revibe.constants import SENSITIVE_FUNCTION_PATTERNS
+from revibe.constants import DATACLASS_SLOTS, MAX_ANALYZE_BYTES, SENSITIVE_FUNCTION_PATTERNS
+from revibe.parallel import parallel_map
 from revibe.patterns import (
-    CLASS_PATTERNS,
+    CLASS_PATTERN_COMBINED,
     COMMENT_PATTERNS,
-    ERROR_HANDLING_PATTERNS,
-    FUNCTION_PATTERNS,
-    IMPORT_PATTERNS,
+    ERROR_HANDLING_PATTERN_COMBINED,
+    FUNCTION_PATTERN_COMBINED,
+    IMPORT_PATTERN_COMBINED,
     STRING_LITERAL_PATTERN,
     TODO_PATTERN,
 )
 from revibe.scanner import SourceFile
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FunctionInfo:
     """Information about a function/method."""
 
@@ -32,7 +35,7 @@ class FunctionInfo:
         return self.line_count > 80
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ClassInfo:
     """Information about a class."""
 
@@ -42,7 +45,7 @@ class ClassInfo:
     method_count: int
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FileAnalysis:
     """Analysis results for a single file."""
 
@@ -58,6 +61,7 @@ class FileAnalysis:
     string_literals: list[str] = field(default_factory=list)
     has_error_handling: bool = False
     complexity_score: float = 0.0
+    skipped: bool = False  # Over the size cap: line counts only
 
     @property
     def function_count(self) -> int:
@@ -92,12 +96,16 @@ def is_sensitive_function(name: str) -> bool:
     return any(pattern in name_lower for pattern in SENSITIVE_FUNCTION_PATTERNS)
 
 
-def analyze_file(source_file: SourceFile) -> Optional[FileAnalysis]:
+def analyze_file(
+    source_file: SourceFile,
+    max_bytes: Optional[int] = MAX_ANALYZE_BYTES,
+) -> Optional[FileAnalysis]:
     """
     Analyze a single source file.
 
     Args:
         source_file: The SourceFile to analyze
+        max_bytes: Files larger than this only get line counts (None or 0 for no limit)
 
     Returns:
         FileAnalysis with results, or None if file can't be read
@@ -114,9 +122,21 @@ def analyze_file(source_file: SourceFile) -> Optional[FileAnalysis]:
     lines = content.splitlines()
     analysis = FileAnalysis(source_file=source_file, total_lines=len(lines))
 
+    if max_bytes and source_file.size_bytes > max_bytes:
+        # Count line types but skip the per-line pattern matching
+        _count_line_types(
+            analysis, lines, COMMENT_PATTERNS.get(source_file.language, ("#", None))
+        )
+        analysis.skipped = True
+        return analysis
+
     # Get patterns for this language
     patterns = _get_language_patterns(source_file.language)
 
+    # One whole-file search rules out per-line TODO scans for most files
+    if not TODO_PATTERN.search(content):
+        patterns["todo"] = None
+
     # Process lines
     _analyze_lines(analysis, lines, patterns)
 
@@ -126,34 +146,35 @@ def analyze_file(source_file: SourceFile) -> Optional[FileAnalysis]:
     return analysis
 
 
-def analyze_files(source_files: list[SourceFile]) -> list[FileAnalysis]:
+def analyze_files(
+    source_files: list[SourceFile],
+    jobs: int = 1,
+    max_bytes: Optional[int] = MAX_ANALYZE_BYTES,
+) -> list[FileAnalysis]:
     """
     Analyze multiple source files.
 
     Args:
         source_files: List of SourceFile objects to analyze
+        jobs: Number of worker processes (files are independent)
+        max_bytes: Files larger than this only get line counts (None or 0 for no limit)
 
     Returns:
         List of FileAnalysis objects (excludes files that couldn't be read)
     """
-    analyses = []
-
-    for source_file in source_files:
-        analysis = analyze_file(source_file)
-        if analysis:
-            analyses.append(analysis)
-
-    return analyses
+    func = partial(analyze_file, max_bytes=max_bytes)
+    return [a for a in parallel_map(func, source_files, jobs) if a]
 
 
 def _get_language_patterns(language: str) -> dict:
     """Get all regex patterns for a specific language."""
     return {
-        "func": FUNCTION_PATTERNS.get(language, []),
-        "class": CLASS_PATTERNS.get(language, []),
-        "import": IMPORT_PATTERNS.get(language, []),
+        "func": FUNCTION_PATTERN_COMBINED.get(language),
+        "class": CLASS_PATTERN_COMBINED.get(language),
+        "import": IMPORT_PATTERN_COMBINED.get(language),
         "comment": COMMENT_PATTERNS.get(language, ("#", None)),
-        "error": ERROR_HANDLING_PATTERNS.get(language, []),
+        "error": ERROR_HANDLING_PATTERN_COMBINED.get(language),
+        "todo": TODO_PATTERN,
     }
 
 
@@ -187,18 +208,38 @@ def _analyze_lines(analysis: FileAnalysis, lines: list[str], patterns: dict):
 
         analysis.code_lines += 1
 
-        # Check structure (functions, classes)
+        # Check structure (functions, classes). Every definition pattern opens
+        # with ^\s*, so matching the stripped line gives the same result without
+        # backtracking over long runs of indentation.
         current_function = _check_functions(
-            analysis, line, i, patterns["func"], current_function
+            analysis, stripped, i, patterns["func"], current_function
         )
         current_class = _check_classes(
-            analysis, line, i, patterns["class"], current_class
+            analysis, stripped, i, patterns["class"], current_class
         )
 
     # Close any open blocks
     _close_remaining_blocks(analysis, len(lines), current_function, current_class)
 
 
+def _count_line_types(analysis: FileAnalysis, lines: list[str], comment: tuple):
+    """Count blank, comment and code lines the same way _analyze_lines does."""
+    single_comment, multi_comment = comment
+    in_multiline_comment = False
+
+    for line in lines:
+        stripped = line.strip()
+        is_comment, in_multiline_comment = _check_comments(
+            stripped, single_comment, multi_comment, in_multiline_comment
+        )
+        if not stripped:
+            analysis.blank_lines += 1
+        elif is_comment:
+            analysis.comment_lines += 1
+        else:
+            analysis.code_lines += 1
+
+
 def _check_comments(
     stripped: str,
     single: str,
@@ -233,22 +274,18 @@ def _check_line_content(
 ):
     """Check line for TODOs, imports, errors, and strings."""
     # Task Markers (TODO/FIXME)
-    todo_match = TODO_PATTERN.search(line)
-    if todo_match:
-        analysis.todos.append((line_num, todo_match.group(1).strip()))
+    if patterns["todo"]:
+        todo_match = patterns["todo"].search(line)
+        if todo_match:
+            analysis.todos.append((line_num, todo_match.group(1).strip()))
 
     # Imports
-    for pattern in patterns["import"]:
-        if pattern.search(line):
-            analysis.imports.append(stripped)
-            break
+    if patterns["import"] and patterns["import"].search(line):
+        analysis.imports.append(stripped)
 
     # Error handling
-    if not analysis.has_error_handling:
-        for pattern in patterns["error"]:
-            if pattern.search(line):
-                analysis.has_error_handling = True
-                break
+    if not analysis.has_error_handling and patterns["error"] and patterns["error"].search(line):
+        analysis.has_error_handling = True
 
     # String literals
     analysis.string_literals.extend(STRING_LITERAL_PATTERN.findall(line))
@@ -258,19 +295,18 @@ def _check_functions(
     analysis: FileAnalysis,
     line: str,
     line_num: int,
-    patterns: list,
+    pattern: Optional[re.Pattern],
     current: Optional[tuple[str, int]]
 ) -> Optional[tuple[str, int]]:
     """Check for function definitions."""
-    for pattern in patterns:
-        match = pattern.search(line)
-        if match:
-            func_name = match.group(1)
+    match = pattern.search(line) if pattern else None
+    if match:
+        func_name = match.group(match.lastindex)
 
-            if current:
-                _close_function(analysis, current, line_num - 1)
+        if current:
+            _close_function(analysis, current, line_num - 1)
 
-            return (func_name, line_num)
+        return (func_name, line_num)
 
     return current
 
@@ -279,19 +315,18 @@ def _check_classes(
     analysis: FileAnalysis,
     line: str,
     line_num: int,
-    patterns: list,
+    pattern: Optional[re.Pattern],
     current: Optional[tuple[str, int, int]]
 ) -> Optional[tuple[str, int, int]]:
     """Check for class definitions."""
-    for pattern in patterns:
-        match = pattern.search(line)
-        if match:
-            class_name = match.group(1)
+    match = pattern.search(line) if pattern else None
+    if match:
+        class_name = match.group(match.lastindex)
 
-            if current:
-                _close_class(analysis, current, line_num - 1)
+        if current:
+            _close_class(analysis, current, line_num - 1)
 
-            return (class_name, line_num, 0)
+        return (class_name, line_num, 0)
 
     return current
 
@@ -9,11 +9,13 @@ from typing import Optional
 
 from revibe import __version__
 from revibe.analyzer import FileAnalysis, analyze_files
+from revibe.constants import MAX_ANALYZE_BYTES
 from revibe.duplicates import DuplicateGroup, find_all_duplicates
-from revibe.fixer import FixerEngine, generate_fix_plan
+from revibe.fixer import FixerEngine, FixPlan, generate_fix_plan
 from revibe.metrics import CodebaseMetrics, aggregate_metrics
+from revibe.parallel import resolve_jobs
 from revibe.report_html import generate_html_report
-from revibe.report_json import generate_json_report
+from revibe.report_json import write_json_report
 from revibe.report_terminal import print_terminal_report
 from revibe.scanner import SourceFile, scan_codebase
 from revibe.smells import detect_all_smells
@@ -57,6 +59,17 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _non_negative_int(value: str) -> int:
+    """argparse type for counts and sizes that may be zero but not negative."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
+
+
 def _add_scan_arguments(parser: argparse.ArgumentParser) -> None:
     """Add arguments for the scan command."""
     parser.add_argument(
@@ -104,6 +117,18 @@ def _add_scan_arguments(parser: argparse.ArgumentParser) -> None:
         metavar="DIRS",
         help="Comma-separated list of additional directories to ignore"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=_non_negative_int,
+        metavar="N",
+        help="Number of worker processes for per-file analysis (default or 0: one per CPU)"
+    )
+    parser.add_argument(
+        "--max-file-size",
+        type=_non_negative_int,
+        metavar="KB",
+        help="Only count lines in files larger than this (default: 2048, 0 for no limit)"
+    )
     parser.add_argument("--quiet", "-q", action="store_true", help="Suppress terminal output (useful with --json)")
     parser.add_argument("--no-color", action="store_true", help="Disable colored output")
 
@@ -118,9 +143,14 @@ def _perform_scan(
     path: Path,
     additional_ignores: Optional[list[str]],
     quiet: bool,
-    json_mode: bool
+    json_mode: bool,
+    jobs: Optional[int] = None,
+    max_file_size: Optional[int] = None,
 ) -> Optional[ScanResult]:
     """Perform the codebase scan and analysis."""
+    jobs = resolve_jobs(jobs)
+    max_bytes = MAX_ANALYZE_BYTES if max_file_size is None else max_file_size * 1024
+
     _log("  Discovering files...", quiet, json_mode)
     source_files = scan_codebase(str(path), additional_ignores)
 
@@ -133,7 +163,10 @@ def _perform_scan(
     _log(f"  Found {len(source_files)} files across {len(langs)} languages", quiet, json_mode)
 
     _log("  Analyzing files...", quiet, json_mode)
-    analyses = analyze_files(source_files)
+    analyses = analyze_files(source_files, jobs=jobs, max_bytes=max_bytes)
+    skipped = sum(1 for a in analyses if a.skipped)
+    if skipped:
+        _log(f"  Counted lines only in {skipped} oversized files", quiet, json_mode)
 
     _log("  Detecting code smells...", quiet, json_mode)
     smell_scores = detect_all_smells(analyses)
@@ -142,7 +175,7 @@ def _perform_scan(
     duplicates = find_all_duplicates(analyses)
 
     _log("  Calculating health score...", quiet, json_mode)
-    metrics = aggregate_metrics(source_files, analyses, smell_scores, duplicates)
+    metrics = aggregate_metrics(source_files, analyses, smell_scores, duplicates, jobs=jobs)
 
     return ScanResult(
         source_files=source_files,
@@ -158,10 +191,12 @@ def _generate_fix_files(
     output_dir: Path,
     path: str,
     metrics: CodebaseMetrics,
+    fix_plan: Optional[FixPlan] = None,
 ) -> None:
     """Generate fix instruction files (markdown, cursor rules, claude)."""
     fixer = FixerEngine(path)
-    fix_plan = generate_fix_plan(path, metrics)
+    if fix_plan is None:
+        fix_plan = generate_fix_plan(path, metrics)
 
     if args.fix:
         fix_path = output_dir / "REVIBE_FIXES.md"
@@ -221,32 +256,44 @@ def run_scan(args: argparse.Namespace) -> int:
     _log("", args.quiet, args.json)
 
     try:
-        result = _perform_scan(path, additional_ignores, args.quiet, args.json)
+        result = _perform_scan(
+            path, additional_ignores, args.quiet, args.json, args.jobs, args.max_file_size
+        )
         if result is None:
             return 0
 
+        show_terminal = not args.quiet and not args.json
+        write_fixes = args.fix or args.cursor or args.claude
+
+        # One fix plan shared by every report that shows fixes
+        fix_plan = None
+        if show_terminal or args.html or write_fixes:
+            fix_plan = generate_fix_plan(str(path), result.metrics)
+
         # Terminal report
-        if not args.quiet and not args.json:
+        if show_terminal:
             print()
-            print_terminal_report(result.metrics, __version__, force_plain=args.no_color)
+            print_terminal_report(
+                result.metrics, __version__, force_plain=args.no_color, fix_plan=fix_plan
+            )
 
         # JSON output
         if args.json:
-            print(generate_json_report(result.metrics, str(path), result.analyses))
+            write_json_report(result.metrics, str(path), result.analyses, sys.stdout)
 
         # HTML report
         if args.html:
             html_path = output_dir / "revibe_report.html"
             try:
-                html_path.write_text(generate_html_report(result.metrics, str(path)), encoding="utf-8")
+                html_path.write_text(generate_html_report(result.metrics, str(path), fix_plan), encoding="utf-8")
                 if not args.quiet:
                     print(f"  📄 HTML report: {html_path}")
             except OSError as e:
                 print(f"  ❌ Failed to write HTML report to {html_path}: {e}", file=sys.stderr)
 
         # Fix files
-        if args.fix or args.cursor or args.claude:
-            _generate_fix_files(args, output_dir, str(path), result.metrics)
+        if write_fixes:
+            _generate_fix_files(args, output_dir, str(path), result.metrics, fix_plan)
 
         _log("", args.quiet, args.json)
         return 0
@@ -1,5 +1,24 @@
 """Constants and configuration for Revibe scanner."""
 
+import sys
+
+# =============================================================================
+# RUNTIME
+# =============================================================================
+
+# Keyword arguments for @dataclass on hot data types. slots=True drops the
+# per-instance __dict__, but it is only available on Python 3.10+.
+DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Minimum number of files before per-file work is spread across processes
+PARALLEL_MIN_ITEMS = 64
+
+# Upper bound on threads listing directories concurrently during a scan
+SCAN_MAX_THREADS = 32
+
+# Files larger than this get line counts only, with no pattern analysis
+# (minified bundles and vendored blobs would otherwise dominate scan time)
+MAX_ANALYZE_BYTES = 2 * 1024 * 1024
 
 # =============================================================================
 # LANGUAGE EXTENSION MAP
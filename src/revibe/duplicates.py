@@ -2,6 +2,7 @@
 
 import hashlib
 from collections import defaultdict
+from operator import attrgetter
 from pathlib import Path
 
 from revibe.analyzer import FileAnalysis
@@ -151,7 +152,7 @@ def find_near_duplicates(
                     ))
 
     # Sort by similarity (highest first)
-    near_duplicates.sort(key=lambda g: g.similarity, reverse=True)
+    near_duplicates.sort(key=attrgetter("similarity"), reverse=True)
 
     return near_duplicates
 
@@ -1,14 +1,15 @@
 """Aggregate metrics and health score calculation for Revibe."""
 
-import re
+import math
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Optional
 
 from revibe.analyzer import FileAnalysis, FunctionInfo
 from revibe.constants import (
     AI_DEFECT_MULTIPLIER,
+    DATACLASS_SLOTS,
     DEFECT_DENSITY_HUMAN_MID,
-    FEATURE_PATTERNS,
     OVER_ENGINEERING_CLASS_DENSITY,
     RISK_LEVEL_ELEVATED,
     RISK_LEVEL_HIGH,
@@ -20,10 +21,12 @@ from revibe.constants import (
     TEST_RATIO_GOOD,
     TEST_RATIO_POOR,
 )
+from revibe.parallel import parallel_map
+from revibe.patterns import FEATURE_REGEXES
 from revibe.scanner import SourceFile
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DuplicateGroup:
     """A group of duplicate or near-duplicate files."""
 
@@ -32,7 +35,7 @@ class DuplicateGroup:
     similarity: float = 1.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CodebaseMetrics:
     """Aggregate metrics for an entire codebase."""
 
@@ -145,35 +148,37 @@ def calculate_defect_estimate(
     return density, estimated
 
 
-def detect_features(analyses: list[FileAnalysis]) -> int:
+def detect_features(analyses: list[FileAnalysis], jobs: int = 1) -> int:
     """
     Detect the number of features/routes/endpoints in the codebase.
 
     Args:
         analyses: List of FileAnalysis objects
+        jobs: Number of worker processes for scanning files
 
     Returns:
         Estimated feature count
     """
-    feature_count = 0
+    targets = [
+        (str(analysis.source_file.path), analysis.source_file.language)
+        for analysis in analyses
+        if analysis.source_file.language in FEATURE_REGEXES
+    ]
 
-    for analysis in analyses:
-        language = analysis.source_file.language
-        patterns = FEATURE_PATTERNS.get(language, [])
+    return sum(parallel_map(_count_features, targets, jobs))
 
-        if not patterns:
-            continue
 
-        try:
-            content = analysis.source_file.path.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            continue
+def _count_features(target: tuple[str, str]) -> int:
+    """Count feature pattern matches in a single file."""
+    path, language = target
 
-        for pattern_str in patterns:
-            matches = re.findall(pattern_str, content)
-            feature_count += len(matches)
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            content = f.read()
+    except OSError:
+        return 0
 
-    return feature_count
+    return sum(len(pattern.findall(content)) for pattern in FEATURE_REGEXES[language])
 
 
 def calculate_health_score(metrics: "CodebaseMetrics") -> int:
@@ -239,18 +244,28 @@ def calculate_health_score(metrics: "CodebaseMetrics") -> int:
     return max(0, min(100, score))
 
 
+# Risk levels from highest threshold to lowest; anything below is CRITICAL
+_RISK_THRESHOLDS: tuple[tuple[int, str], ...] = (
+    (RISK_LEVEL_LOW, "LOW"),
+    (RISK_LEVEL_MODERATE, "MODERATE"),
+    (RISK_LEVEL_ELEVATED, "ELEVATED"),
+    (RISK_LEVEL_HIGH, "HIGH"),
+)
+
+# Risk level for every possible health score (0-100)
+_RISK_TABLE: tuple[str, ...] = tuple(
+    next((level for threshold, level in _RISK_THRESHOLDS if score >= threshold), "CRITICAL")
+    for score in range(101)
+)
+
+
 def determine_risk_level(health_score: int) -> str:
     """Determine risk level from health score."""
-    if health_score >= RISK_LEVEL_LOW:
-        return "LOW"
-    elif health_score >= RISK_LEVEL_MODERATE:
-        return "MODERATE"
-    elif health_score >= RISK_LEVEL_ELEVATED:
-        return "ELEVATED"
-    elif health_score >= RISK_LEVEL_HIGH:
-        return "HIGH"
-    else:
+    # NaN compares false against every threshold, so it falls through to CRITICAL
+    if math.isnan(health_score):
         return "CRITICAL"
+    # Clamp before int() so infinities map to the end buckets instead of raising
+    return _RISK_TABLE[int(max(0, min(100, health_score)))]
 
 
 def aggregate_metrics(
@@ -258,6 +273,7 @@ def aggregate_metrics(
     analyses: list[FileAnalysis],
     smell_scores: Optional[dict[str, float]] = None,
     duplicate_groups: Optional[list[DuplicateGroup]] = None,
+    jobs: int = 1,
 ) -> CodebaseMetrics:
     """
     Aggregate all analyses into codebase-wide metrics.
@@ -267,6 +283,7 @@ def aggregate_metrics(
         analyses: File analyses
         smell_scores: AI smell detection scores
         duplicate_groups: Detected duplicate file groups
+        jobs: Number of worker processes for per-file work
 
     Returns:
         CodebaseMetrics with aggregated data
@@ -284,7 +301,7 @@ def aggregate_metrics(
     _aggregate_analysis_data(metrics, analyses)
 
     # Detect features
-    metrics.feature_count = detect_features(analyses)
+    metrics.feature_count = detect_features(analyses, jobs)
 
     # Calculate derived scores
     _calculate_derived_metrics(metrics)
@@ -294,65 +311,86 @@ def aggregate_metrics(
 
 def _aggregate_file_stats(metrics: CodebaseMetrics, source_files: list[SourceFile]):
     """Calculate basic file counts and language stats."""
-    metrics.source_files = sum(1 for f in source_files if not f.is_test)
-    metrics.test_files = sum(1 for f in source_files if f.is_test)
+    # Count into flat Counters, then build the nested breakdown once
+    lang_files = Counter(f.language for f in source_files)
+    lang_test_files = Counter(f.language for f in source_files if f.is_test)
 
-    for f in source_files:
-        if f.language not in metrics.languages:
-            metrics.languages[f.language] = {"files": 0, "lines": 0, "test_files": 0}
-        metrics.languages[f.language]["files"] += 1
-        if f.is_test:
-            metrics.languages[f.language]["test_files"] += 1
+    metrics.test_files = sum(lang_test_files.values())
+    metrics.source_files = len(source_files) - metrics.test_files
+
+    for lang, files in lang_files.items():
+        metrics.languages[lang] = {"files": files, "lines": 0, "test_files": lang_test_files[lang]}
 
 
 def _aggregate_analysis_data(metrics: CodebaseMetrics, analyses: list[FileAnalysis]):
     """Aggregate data from detailed file analyses."""
+    lang_lines: Counter = Counter()
+    functions_by_file = metrics.functions_by_file
+
+    # Sum into locals and store each total once, rather than updating the
+    # metrics object field by field for every file
+    total_lines = code_lines = comment_lines = blank_lines = 0
+    test_loc = source_loc = 0
+    total_functions = total_classes = total_imports = 0
+
     for analysis in analyses:
-        is_test = analysis.source_file.is_test
-        lang = analysis.source_file.language
+        source_file = analysis.source_file
+        file_code_lines = analysis.code_lines
 
         # Lines
-        metrics.total_lines += analysis.total_lines
-        metrics.code_lines += analysis.code_lines
-        metrics.comment_lines += analysis.comment_lines
-        metrics.blank_lines += analysis.blank_lines
+        total_lines += analysis.total_lines
+        code_lines += file_code_lines
+        comment_lines += analysis.comment_lines
+        blank_lines += analysis.blank_lines
 
-        if is_test:
-            metrics.test_loc += analysis.code_lines
+        if source_file.is_test:
+            test_loc += file_code_lines
         else:
-            metrics.source_loc += analysis.code_lines
+            source_loc += file_code_lines
 
-        if lang in metrics.languages:
-            metrics.languages[lang]["lines"] += analysis.code_lines
+        lang_lines[source_file.language] += file_code_lines
 
         # Counts
-        metrics.total_functions += analysis.function_count
-        metrics.total_classes += analysis.class_count
-        metrics.total_imports += analysis.import_count
+        total_functions += len(analysis.functions)
+        total_classes += len(analysis.classes)
+        total_imports += len(analysis.imports)
 
         # Issues
         _collect_issues(metrics, analysis)
 
         # Store for fixer
-        metrics.functions_by_file[analysis.source_file.relative_path] = analysis.functions
+        functions_by_file[source_file.relative_path] = analysis.functions
+
+    metrics.total_lines += total_lines
+    metrics.code_lines += code_lines
+    metrics.comment_lines += comment_lines
+    metrics.blank_lines += blank_lines
+    metrics.test_loc += test_loc
+    metrics.source_loc += source_loc
+    metrics.total_functions += total_functions
+    metrics.total_classes += total_classes
+    metrics.total_imports += total_imports
+
+    for lang, lines in lang_lines.items():
+        if lang in metrics.languages:
+            metrics.languages[lang]["lines"] += lines
 
 
 def _collect_issues(metrics: CodebaseMetrics, analysis: FileAnalysis):
     """Collect issues (TODOs, long functions, etc) from analysis."""
+    rel = analysis.source_file.relative_path
+
     # Task Markers
-    for line_num, content in analysis.todos:
-        metrics.todos.append((analysis.source_file.relative_path, line_num, content))
+    metrics.todos.extend((rel, line_num, content) for line_num, content in analysis.todos)
 
     # Long functions
-    for func in analysis.long_functions:
-        metrics.long_functions.append((analysis.source_file.relative_path, func))
+    metrics.long_functions.extend((rel, func) for func in analysis.long_functions)
 
     # Sensitive unhandled functions
     if not analysis.has_error_handling:
-        for func in analysis.sensitive_functions:
-            metrics.sensitive_functions_without_error_handling.append(
-                (analysis.source_file.relative_path, func)
-            )
+        metrics.sensitive_functions_without_error_handling.extend(
+            (rel, func) for func in analysis.sensitive_functions
+        )
 
 
 def _calculate_derived_metrics(metrics: CodebaseMetrics):
@@ -0,0 +1,51 @@
+"""Process-pool helpers for per-file work in Revibe."""
+
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, TypeVar
+
+from revibe.constants import PARALLEL_MIN_ITEMS
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """Turn a --jobs value into a worker count (None or 0 means one per CPU)."""
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+def parallel_map(func: Callable[[T], R], items: Iterable[T], jobs: int = 1) -> list[R]:
+    """
+    Apply func to every item, fanning out to worker processes when worthwhile.
+
+    Small batches run serially: process startup costs more than it saves.
+    func and items must be picklable when running in parallel. If worker
+    processes can't be started (some sandboxes and platforms forbid them),
+    the whole batch runs serially instead.
+
+    Args:
+        func: Module-level function taking a single item
+        items: Items to process
+        jobs: Number of worker processes (1 disables parallelism)
+
+    Returns:
+        Results in the same order as items
+    """
+    items = list(items)
+
+    if jobs <= 1 or len(items) < PARALLEL_MIN_ITEMS:
+        return [func(item) for item in items]
+
+    workers = min(jobs, len(items))
+    chunksize = max(1, len(items) // (workers * 4))
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items, chunksize=chunksize))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        return [func(item) for item in items]
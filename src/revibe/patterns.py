@@ -3,6 +3,8 @@
 import re
 from typing import Optional
 
+from revibe.constants import FEATURE_PATTERNS
+
 # Function detection patterns by language
 FUNCTION_PATTERNS: dict[str, list[re.Pattern]] = {
     "Python": [
@@ -134,3 +136,35 @@ TODO_PATTERN = re.compile(r"(?:#|//|/\*|\*|<!--)\s*(?:TODO|FIXME|HACK|XXX|BUG)\s
 
 # String literal patterns (for copy-paste detection)
 STRING_LITERAL_PATTERN = re.compile(r'["\']([^"\']{20,})["\']')
+
+# Feature/route patterns compiled once per language. They are counted one
+# pattern at a time: several overlap (e.g. "...function HomePageRoute"
+# matches both the Page and Route patterns), and a merged alternation
+# would count each such spot only once.
+FEATURE_REGEXES: dict[str, list[re.Pattern]] = {
+    language: [re.compile(p) for p in patterns]
+    for language, patterns in FEATURE_PATTERNS.items()
+    if patterns
+}
+
+
+def _combine(patterns: list[re.Pattern]) -> re.Pattern:
+    """Merge patterns into one alternation that tries them in order."""
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns))
+
+
+# Per-language alternations so each line costs one regex call per category.
+# Function and class branches each hold exactly one capturing group, so the
+# name is always match.group(match.lastindex).
+FUNCTION_PATTERN_COMBINED: dict[str, re.Pattern] = {
+    language: _combine(patterns) for language, patterns in FUNCTION_PATTERNS.items()
+}
+CLASS_PATTERN_COMBINED: dict[str, re.Pattern] = {
+    language: _combine(patterns) for language, patterns in CLASS_PATTERNS.items()
+}
+IMPORT_PATTERN_COMBINED: dict[str, re.Pattern] = {
+    language: _combine(patterns) for language, patterns in IMPORT_PATTERNS.items()
+}
+ERROR_HANDLING_PATTERN_COMBINED: dict[str, re.Pattern] = {
+    language: _combine(patterns) for language, patterns in ERROR_HANDLING_PATTERNS.items()
+}
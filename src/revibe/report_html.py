@@ -1,6 +1,7 @@
 """HTML report generation for Revibe."""
 
 from datetime import datetime
+from functools import lru_cache
 from html import escape
 from typing import Optional
 
@@ -126,8 +127,9 @@ def _generate_html_footer() -> str:
     </footer>'''
 
 
+@lru_cache(maxsize=1)
 def _get_styles() -> str:
-    """Get CSS styles for the report."""
+    """Get CSS styles for the report (assembled once, then cached)."""
     return (
         _get_base_styles() +
         _get_layout_styles() +
@@ -171,6 +173,7 @@ body {
 '''
 
 
+@lru_cache(maxsize=1)
 def _get_layout_styles() -> str:
     """Get all layout-related styles."""
     return _get_structure_styles() + _get_header_styles() + _get_footer_styles()
@@ -274,6 +277,7 @@ footer code {
 '''
 
 
+@lru_cache(maxsize=1)
 def _get_component_styles() -> str:
     """Get all component-related styles."""
     return (
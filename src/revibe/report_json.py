@@ -1,10 +1,23 @@
 """JSON report generation."""
 
 import json
+import re
 from datetime import datetime
+from json.encoder import encode_basestring_ascii
+from operator import itemgetter
+from typing import Optional, TextIO
 
 from revibe.metrics import CodebaseMetrics
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Runs of characters json.dumps would escape under its default ensure_ascii
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]+")
+
 
 def generate_json_report(metrics: CodebaseMetrics, codebase_path: str, files_analysis: list) -> str:
     """
@@ -18,7 +31,63 @@ def generate_json_report(metrics: CodebaseMetrics, codebase_path: str, files_ana
     Returns:
         JSON string
     """
-    report_data = {
+    report_data = _create_report_data(metrics, codebase_path, files_analysis)
+    return _serialize_report(report_data)
+
+
+def _serialize_report(report_data: dict, indent: Optional[int] = 2) -> str:
+    """Serialize report data, or an error report if it is not JSON-serializable."""
+    try:
+        return _dumps(report_data, indent)
+    except (TypeError, ValueError) as e:
+        # Fallback for JSON serialization errors
+        return json.dumps({
+            "error": "Failed to generate JSON report",
+            "details": str(e)
+        }, indent=indent)
+
+
+def _dumps(data: dict, indent: Optional[int] = 2) -> str:
+    """Serialize like json.dumps, using orjson for two-space indentation when installed."""
+    if ORJSON_AVAILABLE and indent == 2:
+        # orjson.JSONEncodeError subclasses TypeError
+        text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        # orjson always emits UTF-8; escape like json.dumps so output stays
+        # ASCII-safe on consoles with narrower encodings
+        if not text.isascii():
+            text = _NON_ASCII_RE.sub(lambda m: encode_basestring_ascii(m.group())[1:-1], text)
+        return text
+    return json.dumps(data, indent=indent)
+
+
+def write_json_report(
+    metrics: CodebaseMetrics,
+    codebase_path: str,
+    files_analysis: list,
+    fp: TextIO,
+    indent: Optional[int] = 2,
+) -> None:
+    """
+    Write a JSON report directly to a file object.
+
+    Produces the same document as ``generate_json_report`` (including its
+    error report when the data is not serializable), followed by a newline.
+
+    Args:
+        metrics: Calculated metrics for the codebase
+        codebase_path: Path to the codebase
+        files_analysis: List of FileAnalysis objects
+        fp: Writable text file object
+        indent: JSON indentation level (None for compact output)
+    """
+    report_data = _create_report_data(metrics, codebase_path, files_analysis)
+    fp.write(_serialize_report(report_data, indent))
+    fp.write("\n")
+
+
+def _create_report_data(metrics: CodebaseMetrics, codebase_path: str, files_analysis: list) -> dict:
+    """Build the full report dictionary."""
+    return {
         "meta": {
             "generated_at": datetime.now().isoformat(),
             "codebase_path": codebase_path,
@@ -32,15 +101,6 @@ def generate_json_report(metrics: CodebaseMetrics, codebase_path: str, files_ana
         "issues": _create_issues(files_analysis, metrics),
     }
 
-    try:
-        return json.dumps(report_data, indent=2)
-    except (TypeError, ValueError) as e:
-        # Fallback for JSON serialization errors
-        return json.dumps({
-            "error": "Failed to generate JSON report",
-            "details": str(e)
-        }, indent=2)
-
 
 def _create_summary(metrics: CodebaseMetrics) -> dict:
     """Create the summary section of the report."""
@@ -111,18 +171,13 @@ def _create_issues(files_analysis: list, metrics: CodebaseMetrics) -> dict:
                 "lines": func.line_count
             })
 
-    # Sort complex files
-    complex_files = sorted(
-        [
-            {
-                "file": a.source_file.relative_path,
-                "score": round(a.complexity_score, 1)
-            }
-            for a in files_analysis if a.complexity_score > 10
-        ],
-        key=lambda x: x["score"],
-        reverse=True
-    )
+    # Round each qualifying score once, then sort the plain tuples
+    complex_scores = [
+        (round(a.complexity_score, 1), a.source_file.relative_path)
+        for a in files_analysis if a.complexity_score > 10
+    ]
+    complex_scores.sort(key=itemgetter(0), reverse=True)
+    complex_files = [{"file": path, "score": score} for score, path in complex_scores]
 
     return {
         "complex_files": complex_files,
@@ -1,11 +1,16 @@
 """Terminal report output for Revibe (with optional rich support)."""
 
+import sys
+from typing import TYPE_CHECKING, Optional
 
 from revibe.metrics import CodebaseMetrics
 
+if TYPE_CHECKING:
+    from revibe.fixer import FixPlan
+
 # Try to import rich for pretty output
 try:
-    from rich.console import Console
+    from rich.console import Console, Group, RenderableType
     from rich.panel import Panel
     from rich.table import Table
     from rich.text import Text
@@ -14,38 +19,66 @@ except ImportError:
     RICH_AVAILABLE = False
 
 
+# Lookup tables shared by both renderers
+_RISK_COLORS = {
+    "LOW": "green",
+    "MODERATE": "yellow",
+    "ELEVATED": "orange1",
+    "HIGH": "red",
+    "CRITICAL": "bold red",
+}
+
+_RISK_EMOJIS = {
+    "LOW": "🟢",
+    "MODERATE": "🟡",
+    "ELEVATED": "🟠",
+    "HIGH": "🔴",
+    "CRITICAL": "🔴",
+}
+
+_PRIORITY_COLORS = {
+    "CRITICAL": "red",
+    "HIGH": "orange1",
+    "MEDIUM": "yellow",
+    "LOW": "green",
+}
+
+_PRIORITY_EMOJIS = {"CRITICAL": "🔴", "HIGH": "🟠", "MEDIUM": "🟡", "LOW": "🟢"}
+
+
 def get_risk_color(risk_level: str) -> str:
     """Get color for risk level."""
-    colors = {
-        "LOW": "green",
-        "MODERATE": "yellow",
-        "ELEVATED": "orange1",
-        "HIGH": "red",
-        "CRITICAL": "bold red",
-    }
-    return colors.get(risk_level, "white")
+    return _RISK_COLORS.get(risk_level, "white")
 
 
 def get_risk_emoji(risk_level: str) -> str:
     """Get emoji for risk level."""
-    emojis = {
-        "LOW": "🟢",
-        "MODERATE": "🟡",
-        "ELEVATED": "🟠",
-        "HIGH": "🔴",
-        "CRITICAL": "🔴",
-    }
-    return emojis.get(risk_level, "⚪")
+    return _RISK_EMOJIS.get(risk_level, "⚪")
+
+
+def _ensure_fix_plan(metrics: CodebaseMetrics, fix_plan: Optional["FixPlan"]) -> "FixPlan":
+    """Use the caller's fix plan, generating one only when none was given."""
+    if fix_plan is None:
+        from revibe.fixer import generate_fix_plan
+        return generate_fix_plan(".", metrics)
+    return fix_plan
 
 
-def print_terminal_report_rich(metrics: CodebaseMetrics, version: str) -> None:
+def print_terminal_report_rich(
+    metrics: CodebaseMetrics,
+    version: str,
+    fix_plan: Optional["FixPlan"] = None,
+) -> None:
     """Print rich terminal report with colors and formatting."""
     console = Console()
 
+    # Renderables are collected and printed in a single call
+    buf: list[RenderableType] = []
+
     # Header
-    console.print()
-    console.print(f"[bold cyan]🔍 Revibe v{version}[/bold cyan] — Scan Complete")
-    console.print()
+    buf.append(Text(""))
+    buf.append(f"[bold cyan]🔍 Revibe v{version}[/bold cyan] — Scan Complete")
+    buf.append(Text(""))
 
     # Health score panel
     risk_color = get_risk_color(metrics.risk_level)
@@ -55,13 +88,13 @@ def print_terminal_report_rich(metrics: CodebaseMetrics, version: str) -> None:
     score_text.append(f"Health Score: {metrics.health_score} / 100\n", style="bold")
     score_text.append(f"Risk Level:   {risk_emoji} {metrics.risk_level}", style=risk_color)
 
-    console.print(Panel(
+    buf.append(Panel(
         score_text,
         title="Codebase Health",
         border_style=risk_color,
         width=40,
     ))
-    console.print()
+    buf.append(Text(""))
 
     # Metrics table
     table = Table(show_header=False, box=None, padding=(0, 2))
@@ -73,100 +106,119 @@ def print_terminal_report_rich(metrics: CodebaseMetrics, version: str) -> None:
     test_ratio_pct = metrics.test_to_code_ratio * 100
     test_status = "⚠️" if test_ratio_pct < 50 else "✅" if test_ratio_pct >= 80 else ""
 
-    table.add_row("Source Code:", f"{metrics.source_loc:,} lines", f"({metrics.source_files} files)")
-    table.add_row("Test Code:", f"{metrics.test_loc:,} lines", f"({metrics.test_files} files)")
-    table.add_row("Test Ratio:", f"{test_ratio_pct:.1f}%", f"{test_status} (target: ≥80%)")
-    table.add_row("Est. Defects:", f"~{metrics.estimated_defects} bugs", "hiding in your code")
-    table.add_row("Features:", f"{metrics.feature_count}", f"({metrics.feature_interactions:,} interaction paths)")
+    rows = [
+        ("Source Code:", f"{metrics.source_loc:,} lines", f"({metrics.source_files} files)"),
+        ("Test Code:", f"{metrics.test_loc:,} lines", f"({metrics.test_files} files)"),
+        ("Test Ratio:", f"{test_ratio_pct:.1f}%", f"{test_status} (target: ≥80%)"),
+        ("Est. Defects:", f"~{metrics.estimated_defects} bugs", "hiding in your code"),
+        ("Features:", f"{metrics.feature_count}", f"({metrics.feature_interactions:,} interaction paths)"),
+    ]
 
     if metrics.duplicate_groups:
-        table.add_row("Duplicates:", f"{len(metrics.duplicate_groups)} groups", "(redundant code)")
+        rows.append(("Duplicates:", f"{len(metrics.duplicate_groups)} groups", "(redundant code)"))
 
     high_smells = sum(1 for s in metrics.ai_smell_scores.values() if s > 0.5)
     if high_smells:
-        table.add_row("AI Smells:", f"{high_smells} of 8", "detected")
+        rows.append(("AI Smells:", f"{high_smells} of 8", "detected"))
+
+    # Cells are plain Text so rich skips markup parsing; column styles still apply
+    for row in rows:
+        table.add_row(*map(Text, row))
 
-    console.print(table)
-    console.print()
+    buf.append(table)
+    buf.append(Text(""))
 
     # Top fixes
-    from revibe.fixer import generate_fix_plan
-    plan = generate_fix_plan(".", metrics)
+    plan = _ensure_fix_plan(metrics, fix_plan)
 
     if plan.fixes:
-        console.print("[bold]Top Fixes:[/bold]")
-        for fix in plan.fixes[:3]:
-            priority_colors = {
-                "CRITICAL": "red",
-                "HIGH": "orange1",
-                "MEDIUM": "yellow",
-                "LOW": "green",
-            }
-            color = priority_colors.get(fix.priority, "white")
-            emoji = {"CRITICAL": "🔴", "HIGH": "🟠", "MEDIUM": "🟡", "LOW": "🟢"}.get(fix.priority, "⚪")
-            console.print(f"  {emoji} [bold {color}]{fix.priority}[/bold {color}]  {fix.title}")
-        console.print()
+        buf.append("[bold]Top Fixes:[/bold]")
+
+        fixes_text = Text()
+        for i, fix in enumerate(plan.fixes[:3]):
+            if i:
+                fixes_text.append("\n")
+            color = _PRIORITY_COLORS.get(fix.priority, "white")
+            emoji = _PRIORITY_EMOJIS.get(fix.priority, "⚪")
+            fixes_text.append(f"  {emoji} ")
+            fixes_text.append(fix.priority, style=f"bold {color}")
+            # render_str keeps rich's number/bracket highlighting without parsing markup
+            fixes_text.append(console.render_str(f"  {fix.title}", markup=False))
+        buf.append(fixes_text)
+        buf.append(Text(""))
 
     # Call to action
-    console.print("[dim]Run [bold]revibe scan . --fix[/bold] to generate copy-paste fix instructions[/dim]")
-    console.print("[dim]Run [bold]revibe scan . --html[/bold] for a detailed visual report[/dim]")
-    console.print()
+    buf.append("[dim]Run [bold]revibe scan . --fix[/bold] to generate copy-paste fix instructions[/dim]")
+    buf.append("[dim]Run [bold]revibe scan . --html[/bold] for a detailed visual report[/dim]")
+    buf.append(Text(""))
+
+    console.print(Group(*buf))
 
 
-def print_terminal_report_plain(metrics: CodebaseMetrics, version: str) -> None:
+def print_terminal_report_plain(
+    metrics: CodebaseMetrics,
+    version: str,
+    fix_plan: Optional["FixPlan"] = None,
+) -> None:
     """Print plain text terminal report (no rich)."""
-    print()
-    print(f"🔍 Revibe v{version} — Scan Complete")
-    print()
+    # Lines are collected and written to stdout in a single call
+    out: list[str] = []
+
+    out.append("")
+    out.append(f"🔍 Revibe v{version} — Scan Complete")
+    out.append("")
 
     # Health score box
     risk_emoji = get_risk_emoji(metrics.risk_level)
-    print("╭─────────────────────────────────────╮")
-    print(f"│     Health Score: {metrics.health_score:3d} / 100          │")
-    print(f"│     Risk Level:   {risk_emoji} {metrics.risk_level:12s}   │")
-    print("╰─────────────────────────────────────╯")
-    print()
+    out.append("╭─────────────────────────────────────╮")
+    out.append(f"│     Health Score: {metrics.health_score:3d} / 100          │")
+    out.append(f"│     Risk Level:   {risk_emoji} {metrics.risk_level:12s}   │")
+    out.append("╰─────────────────────────────────────╯")
+    out.append("")
 
     # Metrics
     test_ratio_pct = metrics.test_to_code_ratio * 100
     test_status = "⚠️" if test_ratio_pct < 50 else "✅" if test_ratio_pct >= 80 else ""
 
-    print(f"  Source Code:    {metrics.source_loc:,} lines ({metrics.source_files} files)")
-    print(f"  Test Code:      {metrics.test_loc:,} lines ({metrics.test_files} files)")
-    print(f"  Test Ratio:     {test_ratio_pct:.1f}% {test_status} (target: ≥80%)")
-    print(f"  Est. Defects:   ~{metrics.estimated_defects} bugs hiding in your code")
-    print(f"  Features:       {metrics.feature_count} ({metrics.feature_interactions:,} interaction paths)")
+    out.append(f"  Source Code:    {metrics.source_loc:,} lines ({metrics.source_files} files)")
+    out.append(f"  Test Code:      {metrics.test_loc:,} lines ({metrics.test_files} files)")
+    out.append(f"  Test Ratio:     {test_ratio_pct:.1f}% {test_status} (target: ≥80%)")
+    out.append(f"  Est. Defects:   ~{metrics.estimated_defects} bugs hiding in your code")
+    out.append(f"  Features:       {metrics.feature_count} ({metrics.feature_interactions:,} interaction paths)")
 
     if metrics.duplicate_groups:
-        print(f"  Duplicates:     {len(metrics.duplicate_groups)} groups (redundant code)")
+        out.append(f"  Duplicates:     {len(metrics.duplicate_groups)} groups (redundant code)")
 
     high_smells = sum(1 for s in metrics.ai_smell_scores.values() if s > 0.5)
     if high_smells:
-        print(f"  AI Smells:      {high_smells} of 8 detected")
+        out.append(f"  AI Smells:      {high_smells} of 8 detected")
 
-    print()
+    out.append("")
 
     # Top fixes
-    from revibe.fixer import generate_fix_plan
-    plan = generate_fix_plan(".", metrics)
+    plan = _ensure_fix_plan(metrics, fix_plan)
 
     if plan.fixes:
-        print("  Top Fixes:")
+        out.append("  Top Fixes:")
         for fix in plan.fixes[:3]:
-            emoji = {"CRITICAL": "🔴", "HIGH": "🟠", "MEDIUM": "🟡", "LOW": "🟢"}.get(fix.priority, "⚪")
-            print(f"  {emoji} {fix.priority:8s}  {fix.title}")
-        print()
+            emoji = _PRIORITY_EMOJIS.get(fix.priority, "⚪")
+            out.append(f"  {emoji} {fix.priority:8s}  {fix.title}")
+        out.append("")
 
     # Call to action
-    print("  Run `revibe scan . --fix` to generate copy-paste fix instructions")
-    print("  Run `revibe scan . --html` for a detailed visual report")
-    print()
+    out.append("  Run `revibe scan . --fix` to generate copy-paste fix instructions")
+    out.append("  Run `revibe scan . --html` for a detailed visual report")
+    out.append("")
+
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
 
 def print_terminal_report(
     metrics: CodebaseMetrics,
     version: str,
     force_plain: bool = False,
+    fix_plan: Optional["FixPlan"] = None,
 ) -> None:
     """
     Print terminal report with optional rich formatting.
@@ -175,8 +227,9 @@ def print_terminal_report(
         metrics: Codebase metrics to report
         version: Revibe version string
         force_plain: Force plain text output even if rich is available
+        fix_plan: Optional pre-generated fix plan
     """
     if RICH_AVAILABLE and not force_plain:
-        print_terminal_report_rich(metrics, version)
+        print_terminal_report_rich(metrics, version, fix_plan)
     else:
-        print_terminal_report_plain(metrics, version)
+        print_terminal_report_plain(metrics, version, fix_plan)
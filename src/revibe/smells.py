@@ -1,18 +1,26 @@
 """AI code smell detection for Revibe."""
 
+import heapq
+import string
 from collections import Counter
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from itertools import chain
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import Optional
 
 from revibe.analyzer import FileAnalysis
 from revibe.constants import (
     BOILERPLATE_IMPORT_RATIO,
     COPY_PASTE_MIN_OCCURRENCES,
+    DATACLASS_SLOTS,
     EXCESSIVE_COMMENT_RATIO,
     VERBOSE_NAME_LENGTH,
 )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SmellResult:
     """Result from a smell detector."""
 
@@ -22,19 +30,105 @@ class SmellResult:
     details: list[str]
 
 
+@dataclass
+class SmellAggregates:
+    """Codebase-wide totals shared by the smell detectors."""
+
+    code_lines: int = 0
+    comment_lines: int = 0
+    functions: int = 0
+    classes: int = 0
+    imports: int = 0
+    function_names: Counter = field(default_factory=Counter)  # Definitions per function name
+
+
+_get_name = attrgetter("name")
+
+
+def compute_smell_aggregates(analyses: list[FileAnalysis]) -> SmellAggregates:
+    """
+    Sum the per-file counts used by the detectors in a single pass.
+
+    Args:
+        analyses: List of FileAnalysis objects
+
+    Returns:
+        SmellAggregates with the codebase totals
+    """
+    code_lines = comment_lines = functions = classes = imports = 0
+    function_names: Counter = Counter()
+
+    for a in analyses:
+        code_lines += a.code_lines
+        comment_lines += a.comment_lines
+        functions += len(a.functions)
+        function_names.update(map(_get_name, a.functions))
+        classes += len(a.classes)
+        imports += len(a.imports)
+
+    return SmellAggregates(
+        code_lines=code_lines,
+        comment_lines=comment_lines,
+        functions=functions,
+        classes=classes,
+        imports=imports,
+        function_names=function_names,
+    )
+
+
+# Maps ASCII letters and underscores to class markers for naming checks
+_NAME_CLASS_TABLE = str.maketrans(
+    {**dict.fromkeys(string.ascii_uppercase, "U"),
+     **dict.fromkeys(string.ascii_lowercase, "L"),
+     "_": "S"}
+)
+
+
+# Entry-point and lifecycle names expected to repeat across files
+_COMMON_FUNCTION_NAMES = frozenset({"__init__", "main", "setup", "teardown", "run"})
+
+
+def _naming_style(name: str) -> Optional[str]:
+    """Classify a name as "snake", "pascal", "camel", or None."""
+    if name.isascii():
+        # One translate pass, then cheap membership checks on the markers
+        marks = name.translate(_NAME_CLASS_TABLE)
+        has_under = "S" in marks
+        has_upper = "U" in marks
+        if has_under and not has_upper and "L" in marks:
+            return "snake"
+        if marks[0] == "U" and not has_under:
+            return "pascal"
+        if marks[0] == "L" and has_upper:
+            return "camel"
+        return None
+
+    if "_" in name and name.islower():
+        return "snake"
+    if name[0].isupper() and "_" not in name:
+        return "pascal"
+    if name[0].islower() and any(c.isupper() for c in name):
+        return "camel"
+    return None
+
+
 def clamp_score(score: float) -> float:
     """Clamp a score to the 0.0-1.0 range."""
     return max(0.0, min(1.0, score))
 
 
-def detect_excessive_comments(analyses: list[FileAnalysis]) -> SmellResult:
+def detect_excessive_comments(
+    analyses: list[FileAnalysis],
+    aggregates: Optional[SmellAggregates] = None,
+) -> SmellResult:
     """
     Detect excessive comment-to-code ratio.
 
     AI-generated code often has verbose explanatory comments.
     """
-    total_code = sum(a.code_lines for a in analyses)
-    total_comments = sum(a.comment_lines for a in analyses)
+    aggregates = aggregates or compute_smell_aggregates(analyses)
+    total_code = aggregates.code_lines
+    total_comments = aggregates.comment_lines
 
     if total_code == 0:
         return SmellResult(
@@ -50,17 +144,13 @@ def detect_excessive_comments(analyses: list[FileAnalysis]) -> SmellResult:
     details = []
     if score > 0.5:
         # Find files with highest comment ratios
-        high_comment_files = []
-        for a in analyses:
-            if a.code_lines > 0:
-                file_ratio = a.comment_lines / a.code_lines
-                if file_ratio > EXCESSIVE_COMMENT_RATIO:
-                    high_comment_files.append(
-                        (a.source_file.relative_path, file_ratio)
-                    )
+        high_comment_files = (
+            (a.source_file.relative_path, a.comment_lines / a.code_lines)
+            for a in analyses
+            if a.code_lines > 0 and a.comment_lines / a.code_lines > EXCESSIVE_COMMENT_RATIO
+        )
 
-        high_comment_files.sort(key=lambda x: x[1], reverse=True)
-        for path, r in high_comment_files[:5]:
+        for path, r in heapq.nlargest(5, high_comment_files, key=itemgetter(1)):
             details.append(f"{path}: {r:.1%} comments")
 
     return SmellResult(
@@ -71,26 +161,28 @@ def detect_excessive_comments(analyses: list[FileAnalysis]) -> SmellResult:
     )
 
 
-def detect_verbose_naming(analyses: list[FileAnalysis]) -> SmellResult:
+def detect_verbose_naming(
+    analyses: list[FileAnalysis],
+    aggregates: Optional[SmellAggregates] = None,  # Unused; every detector takes (analyses, aggregates)
+) -> SmellResult:
     """
     Detect overly verbose function/variable names.
 
     AI often generates extremely descriptive names like
     'handleUserAuthenticationWithPasswordAndTwoFactorVerification'.
     """
-    verbose_names = []
+    verbose_count = 0
     total_names = 0
+    # Only the first five are reported, so nothing more is kept
+    examples: list[tuple[str, str]] = []
 
     for a in analyses:
-        for func in a.functions:
-            total_names += 1
-            if len(func.name) > VERBOSE_NAME_LENGTH:
-                verbose_names.append((a.source_file.relative_path, func.name))
-
-        for cls in a.classes:
+        for sym in chain(a.functions, a.classes):
             total_names += 1
-            if len(cls.name) > VERBOSE_NAME_LENGTH:
-                verbose_names.append((a.source_file.relative_path, cls.name))
+            if len(sym.name) > VERBOSE_NAME_LENGTH:
+                verbose_count += 1
+                if len(examples) < 5:
+                    examples.append((a.source_file.relative_path, sym.name))
 
     if total_names == 0:
         return SmellResult(
@@ -100,27 +192,31 @@ def detect_verbose_naming(analyses: list[FileAnalysis]) -> SmellResult:
             details=[],
         )
 
-    ratio = len(verbose_names) / total_names
+    ratio = verbose_count / total_names
     score = clamp_score(ratio * 2)  # Amplify since verbose names are less common
 
-    details = [f"{path}: {name}" for path, name in verbose_names[:5]]
+    details = [f"{path}: {name}" for path, name in examples]
 
     return SmellResult(
         name="verbose_naming",
         score=score,
-        description=f"{len(verbose_names)} names exceed {VERBOSE_NAME_LENGTH} chars",
+        description=f"{verbose_count} names exceed {VERBOSE_NAME_LENGTH} chars",
         details=details,
     )
 
 
-def detect_boilerplate_heavy(analyses: list[FileAnalysis]) -> SmellResult:
+def detect_boilerplate_heavy(
+    analyses: list[FileAnalysis],
+    aggregates: Optional[SmellAggregates] = None,
+) -> SmellResult:
     """
     Detect high import-to-function ratio.
 
     AI-generated code often imports many libraries without using them fully.
     """
-    total_imports = sum(len(a.imports) for a in analyses)
-    total_functions = sum(len(a.functions) for a in analyses)
+    aggregates = aggregates or compute_smell_aggregates(analyses)
+    total_imports = aggregates.imports
+    total_functions = aggregates.functions
 
     if total_functions == 0:
         return SmellResult(
@@ -135,7 +231,7 @@ def detect_boilerplate_heavy(analyses: list[FileAnalysis]) -> SmellResult:
 
     details = []
     if score > 0.3:
-        # Find files with high import ratios
+        # Find files with high import ratios (first five are reported)
         for a in analyses:
             if len(a.functions) > 0:
                 file_ratio = len(a.imports) / len(a.functions)
@@ -143,34 +239,36 @@ def detect_boilerplate_heavy(analyses: list[FileAnalysis]) -> SmellResult:
                     details.append(
                         f"{a.source_file.relative_path}: {len(a.imports)} imports, {len(a.functions)} functions"
                     )
+                    if len(details) == 5:
+                        break
 
     return SmellResult(
         name="boilerplate_heavy",
         score=score,
         description=f"Import-to-function ratio: {ratio:.1f}",
-        details=details[:5],
+        details=details,
     )
 
 
-def detect_inconsistent_patterns(analyses: list[FileAnalysis]) -> SmellResult:
+def detect_inconsistent_patterns(
+    analyses: list[FileAnalysis],
+    aggregates: Optional[SmellAggregates] = None,
+) -> SmellResult:
     """
     Detect mixed naming conventions within the codebase.
 
     AI-generated code often mixes camelCase and snake_case inconsistently.
     """
-    snake_case_count = 0
-    camel_case_count = 0
-    pascal_case_count = 0
+    aggregates = aggregates or compute_smell_aggregates(analyses)
 
-    for a in analyses:
-        for func in a.functions:
-            name = func.name
-            if "_" in name and name.islower():
-                snake_case_count += 1
-            elif name[0].isupper() and "_" not in name:
-                pascal_case_count += 1
-            elif name[0].islower() and any(c.isupper() for c in name):
-                camel_case_count += 1
+    # Names repeat across files, so classify each distinct name once
+    styles: Counter = Counter()
+    for name, count in aggregates.function_names.items():
+        styles[_naming_style(name)] += count
+
+    snake_case_count = styles["snake"]
+    camel_case_count = styles["camel"]
+    pascal_case_count = styles["pascal"]
 
     total = snake_case_count + camel_case_count + pascal_case_count
 
@@ -204,27 +302,25 @@ def detect_inconsistent_patterns(analyses: list[FileAnalysis]) -> SmellResult:
     )
 
 
-def detect_dead_code_indicators(analyses: list[FileAnalysis]) -> SmellResult:
+def detect_dead_code_indicators(
+    analyses: list[FileAnalysis],
+    aggregates: Optional[SmellAggregates] = None,
+) -> SmellResult:
     """
     Detect duplicate function names across files.
 
     AI often re-implements the same function in multiple files.
     """
-    function_locations: dict[str, list[str]] = {}
+    aggregates = aggregates or compute_smell_aggregates(analyses)
 
-    for a in analyses:
-        for func in a.functions:
-            if func.name not in function_locations:
-                function_locations[func.name] = []
-            function_locations[func.name].append(a.source_file.relative_path)
-
-    # Find functions defined in multiple files
+    # Only the number of definitions per name is reported, so the shared
+    # name counts stand in for a list of files for each one
     duplicates = {
-        name: files for name, files in function_locations.items()
-        if len(files) > 1 and name not in ("__init__", "main", "setup", "teardown", "run")
+        name: count for name, count in aggregates.function_names.items()
+        if count > 1 and name not in _COMMON_FUNCTION_NAMES
     }
 
-    total_functions = sum(len(a.functions) for a in analyses)
+    total_functions = aggregates.functions
     if total_functions == 0:
         return SmellResult(
             name="dead_code_indicators",
@@ -233,12 +329,12 @@ def detect_dead_code_indicators(analyses: list[FileAnalysis]) -> SmellResult:
             details=[],
         )
 
-    duplicate_count = sum(len(files) for files in duplicates.values())
+    duplicate_count = sum(duplicates.values())
     score = clamp_score(duplicate_count / total_functions * 5)
 
     details = [
-        f"{name}: defined in {len(files)} files"
-        for name, files in sorted(duplicates.items(), key=lambda x: -len(x[1]))[:5]
+        f"{name}: defined in {count} files"
+        for name, count in heapq.nlargest(5, duplicates.items(), key=itemgetter(1))
     ]
 
     return SmellResult(
@@ -249,14 +345,18 @@ def detect_dead_code_indicators(analyses: list[FileAnalysis]) -> SmellResult:
     )
 
 
-def detect_over_engineering(analyses: list[FileAnalysis]) -> SmellResult:
+def detect_over_engineering(
+    analyses: list[FileAnalysis],
+    aggregates: Optional[SmellAggregates] = None,
+) -> SmellResult:
     """
     Detect excessive class density.
 
     AI-generated code sometimes creates unnecessary class hierarchies.
     """
-    total_classes = sum(len(a.classes) for a in analyses)
-    total_loc = sum(a.code_lines for a in analyses)
+    aggregates = aggregates or compute_smell_aggregates(analyses)
+    total_classes = aggregates.classes
+    total_loc = aggregates.code_lines
 
     if total_loc < 100:
         return SmellResult(
@@ -274,22 +374,27 @@ def detect_over_engineering(analyses: list[FileAnalysis]) -> SmellResult:
 
     details = []
     if score > 0.3:
-        # Find files with many small classes
+        # Find files with many small classes (first five are reported)
         for a in analyses:
             if len(a.classes) > 3 and a.code_lines < 200:
                 details.append(
                     f"{a.source_file.relative_path}: {len(a.classes)} classes in {a.code_lines} lines"
                 )
+                if len(details) == 5:
+                    break
 
     return SmellResult(
         name="over_engineering",
         score=score,
         description=f"Class density: {class_density:.1f} per KLOC",
-        details=details[:5],
+        details=details,
     )
 
 
-def detect_missing_error_handling(analyses: list[FileAnalysis]) -> SmellResult:
+def detect_missing_error_handling(
+    analyses: list[FileAnalysis],
+    aggregates: Optional[SmellAggregates] = None,  # Unused; every detector takes (analyses, aggregates)
+) -> SmellResult:
     """
     Detect functions without error handling.
 
@@ -327,7 +432,7 @@ def detect_missing_error_handling(analyses: list[FileAnalysis]) -> SmellResult:
 
     details = [
         f"{path}: {count} functions, no error handling"
-        for path, count in sorted(files_without_handling, key=lambda x: -x[1])[:5]
+        for path, count in heapq.nlargest(5, files_without_handling, key=itemgetter(1))
     ]
 
     return SmellResult(
@@ -338,7 +443,10 @@ def detect_missing_error_handling(analyses: list[FileAnalysis]) -> SmellResult:
     )
 
 
-def detect_copy_paste_artifacts(analyses: list[FileAnalysis]) -> SmellResult:
+def detect_copy_paste_artifacts(
+    analyses: list[FileAnalysis],
+    aggregates: Optional[SmellAggregates] = None,  # Unused; every detector takes (analyses, aggregates)
+) -> SmellResult:
     """
     Detect repeated string literals across files.
 
@@ -349,12 +457,6 @@ def detect_copy_paste_artifacts(analyses: list[FileAnalysis]) -> SmellResult:
     for a in analyses:
         all_strings.update(a.string_literals)
 
-    # Find strings that appear too many times
-    repeated = [
-        (s, count) for s, count in all_strings.items()
-        if count >= COPY_PASTE_MIN_OCCURRENCES and len(s) > 20
-    ]
-
     total_strings = sum(all_strings.values())
     if total_strings < 10:
         return SmellResult(
@@ -364,12 +466,22 @@ def detect_copy_paste_artifacts(analyses: list[FileAnalysis]) -> SmellResult:
             details=[],
         )
 
-    repeated_count = sum(count for _, count in repeated)
+    # Find strings that appear too many times; most_common() is sorted by
+    # count, so the scan stops at the first string below the threshold
+    repeated = []
+    repeated_count = 0
+    for s, count in all_strings.most_common():
+        if count < COPY_PASTE_MIN_OCCURRENCES:
+            break
+        if len(s) > 20:
+            repeated.append((s, count))
+            repeated_count += count
+
     score = clamp_score(repeated_count / total_strings * 2)
 
     details = [
         f'"{s[:40]}..." appears {count} times'
-        for s, count in sorted(repeated, key=lambda x: -x[1])[:5]
+        for s, count in repeated[:5]
     ]
 
     return SmellResult(
@@ -390,6 +502,10 @@ def detect_all_smells(analyses: list[FileAnalysis]) -> dict[str, float]:
     Returns:
         Dictionary mapping smell names to scores (0.0-1.0)
     """
+    # Every detector scores an empty codebase as 0.0
+    if not analyses:
+        return dict.fromkeys(_SMELL_DESCRIPTIONS, 0.0)
+
     detectors = [
         detect_excessive_comments,
         detect_verbose_naming,
@@ -401,10 +517,18 @@ def detect_all_smells(analyses: list[FileAnalysis]) -> dict[str, float]:
         detect_copy_paste_artifacts,
     ]
 
+    # Totals are shared so each detector doesn't re-sum them. If they can't
+    # be built, each detector computes (and fails on) its own, so one bad
+    # analysis only zeroes the detectors that need the broken field.
+    try:
+        aggregates: Optional[SmellAggregates] = compute_smell_aggregates(analyses)
+    except Exception:
+        aggregates = None
+
     results = {}
     for detector in detectors:
         try:
-            result = detector(analyses)
+            result = detector(analyses, aggregates)
             results[result.name] = result.score
         except Exception:
             # If a specific detector fails to get scores, skip or set to 0.0
@@ -413,15 +537,19 @@ def detect_all_smells(analyses: list[FileAnalysis]) -> dict[str, float]:
     return results
 
 
-def get_smell_descriptions() -> dict[str, str]:
+# Read-only so every caller can share the one instance
+_SMELL_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "excessive_comments": "High ratio of comments to code (AI tends to over-explain)",
+    "verbose_naming": "Overly long function/variable names (> 35 characters)",
+    "boilerplate_heavy": "Many imports relative to actual functions",
+    "inconsistent_patterns": "Mixed naming conventions (camelCase vs snake_case)",
+    "dead_code_indicators": "Same function defined in multiple files",
+    "over_engineering": "Too many classes relative to codebase size",
+    "missing_error_handling": "Functions without try/catch or error handling",
+    "copy_paste_artifacts": "Repeated string patterns across files",
+})
+
+
+def get_smell_descriptions() -> Mapping[str, str]:
     """Get human-readable descriptions for each smell."""
-    return {
-        "excessive_comments": "High ratio of comments to code (AI tends to over-explain)",
-        "verbose_naming": "Overly long function/variable names (> 35 characters)",
-        "boilerplate_heavy": "Many imports relative to actual functions",
-        "inconsistent_patterns": "Mixed naming conventions (camelCase vs snake_case)",
-        "dead_code_indicators": "Same function defined in multiple files",
-        "over_engineering": "Too many classes relative to codebase size",
-        "missing_error_handling": "Functions without try/catch or error handling",
-        "copy_paste_artifacts": "Repeated string patterns across files",
-    }
+    return _SMELL_DESCRIPTIONS
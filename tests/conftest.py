@@ -1,26 +1,92 @@
 """Pytest configuration and fixtures for Revibe tests."""
 
+import os
+import shutil
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import MagicMock
 
 import pytest
 
+from revibe.analyzer import FileAnalysis, FunctionInfo, analyze_files
+from revibe.duplicates import DuplicateGroup, find_all_duplicates
+from revibe.fixer import generate_fix_plan
+from revibe.metrics import CodebaseMetrics, aggregate_metrics
+from revibe.scanner import SourceFile, scan_codebase
+from revibe.smells import detect_all_smells
+
+
+# Set by pytest_configure when REVIBE_TEST_TMPFS opts in to a tmpfs basetemp
+_tmpfs_basetemp: Optional[str] = None
+
+
+def pytest_configure(config):
+    """Put tmp_path on tmpfs (/dev/shm) when REVIBE_TEST_TMPFS=1 and no --basetemp was given."""
+    global _tmpfs_basetemp
+    shm = Path("/dev/shm")
+    if os.environ.get("REVIBE_TEST_TMPFS") != "1" or config.option.basetemp or not shm.is_dir():
+        return
+    # A fresh private directory per session: pytest wipes a given basetemp at
+    # startup, so a shared fixed path would let concurrent runs clobber each other
+    _tmpfs_basetemp = tempfile.mkdtemp(prefix="revibe-pytest-", dir=shm)
+    config.option.basetemp = _tmpfs_basetemp
+
+
+def pytest_unconfigure(config):
+    """Remove the tmpfs basetemp created by pytest_configure, if any."""
+    if _tmpfs_basetemp is not None:
+        shutil.rmtree(_tmpfs_basetemp, ignore_errors=True)
+
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_dir(tmp_path):
+    """Temporary directory for tests (pytest's tmp_path, cleaned up lazily)."""
+    return tmp_path
 
 
 @pytest.fixture
-def healthy_project(temp_dir):
-    """Create a healthy project fixture with good test coverage."""
+def fake_valid_path(monkeypatch):
+    """Make every Path report that it exists and is a directory."""
+    monkeypatch.setattr(Path, "exists", lambda self, *args, **kwargs: True)
+    monkeypatch.setattr(Path, "is_dir", lambda self, *args, **kwargs: True)
+
+
+def _encode_tree(files: dict[str, str]) -> dict[str, bytes]:
+    """Encode {relative path: content} once so fixtures can write raw bytes."""
+    return {rel: content.encode() for rel, content in files.items()}
+
+
+def _write_tree(root: Path, files: dict[str, bytes]) -> None:
+    """
+    Write {relative path: bytes} files under root, creating directories.
+
+    Files whose content was already written are hard-linked to the first copy,
+    falling back to a plain write where the filesystem refuses links.
+    """
+    written: dict[bytes, Path] = {}
+    for rel, data in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        first = written.get(data)
+        if first is not None:
+            try:
+                os.link(first, path)
+                continue
+            except OSError:
+                pass
+        written.setdefault(data, path)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+
+_HEALTHY_FILES: dict[str, bytes] = _encode_tree({
     # Main source file
-    src_dir = temp_dir / "src"
-    src_dir.mkdir()
-
-    (src_dir / "app.py").write_text('''"""Main application module."""
+    "src/app.py": '''"""Main application module."""
 
 def greet(name: str) -> str:
     """Greet a user by name."""
@@ -40,9 +106,8 @@ def divide_numbers(a: float, b: float) -> float:
         return a / b
     except ZeroDivisionError:
         raise ValueError("Cannot divide by zero")
-''')
-
-    (src_dir / "utils.py").write_text('''"""Utility functions."""
+''',
+    "src/utils.py": '''"""Utility functions."""
 
 def validate_email(email: str) -> bool:
     """Validate an email address."""
@@ -52,13 +117,9 @@ def validate_email(email: str) -> bool:
 def format_date(year: int, month: int, day: int) -> str:
     """Format a date as YYYY-MM-DD."""
     return f"{year:04d}-{month:02d}-{day:02d}"
-''')
-
+''',
     # Test files
-    tests_dir = temp_dir / "tests"
-    tests_dir.mkdir()
-
-    (tests_dir / "test_app.py").write_text('''"""Tests for app module."""
+    "tests/test_app.py": '''"""Tests for app module."""
 
 import pytest
 from src.app import greet, add_numbers, divide_numbers
@@ -88,9 +149,8 @@ def test_divide_numbers():
 def test_divide_by_zero():
     with pytest.raises(ValueError):
         divide_numbers(10, 0)
-''')
-
-    (tests_dir / "test_utils.py").write_text('''"""Tests for utils module."""
+''',
+    "tests/test_utils.py": '''"""Tests for utils module."""
 
 from src.utils import validate_email, format_date
 
@@ -105,20 +165,19 @@ def test_validate_email_invalid():
 
 def test_format_date():
     assert format_date(2026, 1, 31) == "2026-01-31"
-''')
+''',
+})
 
-    return temp_dir
 
+def _build_healthy_project(root: Path) -> Path:
+    """Write a healthy project with good test coverage under root."""
+    _write_tree(root, _HEALTHY_FILES)
+    return root
 
-@pytest.fixture
-def bloated_project(temp_dir):
-    """Create a bloated project with many issues."""
-    src_dir = temp_dir / "src"
-    src_dir.mkdir()
 
+_BLOATED_FILES: dict[str, bytes] = _encode_tree({
     # Verbose naming
-    (src_dir / "very_long_module_name_that_handles_user_authentication.py").write_text(
-        '''"""A module with overly verbose naming."""
+    "src/very_long_module_name_that_handles_user_authentication.py": '''"""A module with overly verbose naming."""
 
 def handle_user_authentication_with_password_and_two_factor_verification(username, password, two_factor_code):
     """This function has an extremely long name that is typical of AI-generated code."""
@@ -140,43 +199,26 @@ class UserAuthenticationManagerWithSessionHandling:
 
     def authenticate_user_and_create_session_token(self):
         pass
-''')
-
+''',
     # Duplicate files
-    (src_dir / "helpers.py").write_text('''"""Helper functions."""
+    "src/helpers.py": '''"""Helper functions."""
 
 def format_name(first, last):
     return f"{first} {last}"
 
 def calculate_total(items):
     return sum(items)
-''')
-
-    (src_dir / "helpers_v2.py").write_text('''"""Helper functions."""
+''',
+    "src/helpers_v2.py": '''"""Helper functions."""
 
 def format_name(first, last):
     return f"{first} {last}"
 
 def calculate_total(items):
     return sum(items)
-''')
-
-    # Many files with little content
-    utils_dir = src_dir / "utils"
-    utils_dir.mkdir()
-
-    for i in range(10):
-        (utils_dir / f"util_{i}.py").write_text(f'''"""Utility {i}."""
-
-def utility_function_{i}():
-    pass
-
-class UtilityClass{i}:
-    pass
-''')
-
+''',
     # Over-commented file
-    (src_dir / "over_commented.py").write_text('''"""This module is over-commented."""
+    "src/over_commented.py": '''"""This module is over-commented."""
 
 # Import the os module for operating system operations
 import os  # os module
@@ -191,18 +233,31 @@ def print_hello():
     print("hello")  # prints hello
     # Return nothing
     return None  # returns None
-''')
+''',
+})
 
-    return temp_dir
+# Many files with little content
+_BLOATED_FILES.update(_encode_tree({
+    f"src/utils/util_{i}.py": f'''"""Utility {i}."""
 
+def utility_function_{i}():
+    pass
+
+class UtilityClass{i}:
+    pass
+'''
+    for i in range(10)
+}))
 
-@pytest.fixture
-def no_tests_project(temp_dir):
-    """Create a project with no test files."""
-    src_dir = temp_dir / "src"
-    src_dir.mkdir()
 
-    (src_dir / "main.py").write_text('''"""Main module without tests."""
+def _build_bloated_project(root: Path) -> Path:
+    """Write a bloated project with many issues under root."""
+    _write_tree(root, _BLOATED_FILES)
+    return root
+
+
+_NO_TESTS_FILES: dict[str, bytes] = _encode_tree({
+    "src/main.py": '''"""Main module without tests."""
 
 def process_payment(amount, card_number):
     """Process a payment - no error handling!"""
@@ -217,9 +272,8 @@ def authenticate_user(username, password):
 def delete_user(user_id):
     """Delete a user from the database."""
     return True
-''')
-
-    (src_dir / "api.py").write_text('''"""API endpoints."""
+''',
+    "src/api.py": '''"""API endpoints."""
 
 def get_users():
     return []
@@ -232,9 +286,8 @@ def update_user(user_id, data):
 
 def delete_user(user_id):
     return True
-''')
-
-    (src_dir / "models.py").write_text('''"""Data models."""
+''',
+    "src/models.py": '''"""Data models."""
 
 class User:
     def __init__(self, name, email):
@@ -252,27 +305,25 @@ class Order:
 
     def calculate_total(self):
         return sum(item["price"] for item in self.items)
-''')
+''',
+})
 
-    return temp_dir
 
+def _build_no_tests_project(root: Path) -> Path:
+    """Write a project with no test files under root."""
+    _write_tree(root, _NO_TESTS_FILES)
+    return root
 
-@pytest.fixture
-def mixed_languages_project(temp_dir):
-    """Create a project with multiple programming languages."""
+
+_MIXED_LANGUAGES_FILES: dict[str, bytes] = _encode_tree({
     # Python
-    py_dir = temp_dir / "python"
-    py_dir.mkdir()
-    (py_dir / "app.py").write_text('''"""Python app."""
+    "python/app.py": '''"""Python app."""
 
 def main():
     print("Hello from Python")
-''')
-
+''',
     # JavaScript
-    js_dir = temp_dir / "javascript"
-    js_dir.mkdir()
-    (js_dir / "app.js").write_text('''// JavaScript app
+    "javascript/app.js": '''// JavaScript app
 
 function main() {
     console.log("Hello from JavaScript");
@@ -281,12 +332,9 @@ function main() {
 const greet = (name) => {
     return `Hello, ${name}!`;
 };
-''')
-
+''',
     # TypeScript
-    ts_dir = temp_dir / "typescript"
-    ts_dir.mkdir()
-    (ts_dir / "app.ts").write_text('''// TypeScript app
+    "typescript/app.ts": '''// TypeScript app
 
 function main(): void {
     console.log("Hello from TypeScript");
@@ -295,12 +343,9 @@ function main(): void {
 const greet = (name: string): string => {
     return `Hello, ${name}!`;
 };
-''')
-
+''',
     # Go
-    go_dir = temp_dir / "golang"
-    go_dir.mkdir()
-    (go_dir / "main.go").write_text('''package main
+    "golang/main.go": '''package main
 
 import "fmt"
 
@@ -311,12 +356,240 @@ func main() {
 func greet(name string) string {
     return "Hello, " + name + "!"
 }
-''')
+''',
+})
+
+
+def _build_mixed_languages_project(root: Path) -> Path:
+    """Write a project with multiple programming languages under root."""
+    _write_tree(root, _MIXED_LANGUAGES_FILES)
+    return root
+
+
+def _run_pipeline(root, files, analyses) -> SimpleNamespace:
+    """Finish the scan pipeline (smells, duplicates, metrics, fix plan) for analyzed files."""
+    smells = detect_all_smells(analyses)
+    duplicates = find_all_duplicates(analyses)
+    metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    return SimpleNamespace(
+        files=files,
+        analyses=analyses,
+        smells=smells,
+        duplicates=duplicates,
+        metrics=metrics,
+        fix_plan=generate_fix_plan(str(root), metrics),
+    )
 
+
+@pytest.fixture(scope="session")
+def _healthy_project_template(tmp_path_factory):
+    """Build the healthy project once per session."""
+    return _build_healthy_project(tmp_path_factory.mktemp("healthy_project"))
+
+
+@pytest.fixture
+def healthy_project(temp_dir, _healthy_project_template):
+    """Fresh copy of the healthy project that the test may modify."""
+    shutil.copytree(_healthy_project_template, temp_dir, dirs_exist_ok=True)
+    return temp_dir
+
+
+@pytest.fixture
+def healthy_project_readonly(_healthy_project_template):
+    """Shared copy of the healthy project; tests must not modify it."""
+    return _healthy_project_template
+
+
+@pytest.fixture(scope="session")
+def analyzed_healthy_project(_healthy_project_template):
+    """Scan and analyze the healthy project once; returns (files, analyses)."""
+    files = scan_codebase(str(_healthy_project_template))
+    return files, analyze_files(files)
+
+
+@pytest.fixture(scope="session")
+def healthy_pipeline(_healthy_project_template, analyzed_healthy_project):
+    """Healthy project pipeline results (files through fix plan), computed once."""
+    return _run_pipeline(_healthy_project_template, *analyzed_healthy_project)
+
+
+@pytest.fixture(scope="session")
+def _bloated_project_template(tmp_path_factory):
+    """Build the bloated project once per session."""
+    return _build_bloated_project(tmp_path_factory.mktemp("bloated_project"))
+
+
+@pytest.fixture
+def bloated_project(temp_dir, _bloated_project_template):
+    """Fresh copy of the bloated project that the test may modify."""
+    shutil.copytree(_bloated_project_template, temp_dir, dirs_exist_ok=True)
+    return temp_dir
+
+
+@pytest.fixture
+def bloated_project_readonly(_bloated_project_template):
+    """Shared copy of the bloated project; tests must not modify it."""
+    return _bloated_project_template
+
+
+@pytest.fixture(scope="session")
+def bloated_pipeline(_bloated_project_template):
+    """Pipeline results for the bloated project, computed once."""
+    files = scan_codebase(str(_bloated_project_template))
+    return _run_pipeline(_bloated_project_template, files, analyze_files(files))
+
+
+@pytest.fixture(scope="session")
+def _no_tests_project_template(tmp_path_factory):
+    """Build the project without tests once per session."""
+    return _build_no_tests_project(tmp_path_factory.mktemp("no_tests_project"))
+
+
+@pytest.fixture
+def no_tests_project(temp_dir, _no_tests_project_template):
+    """Fresh copy of the project without tests that the test may modify."""
+    shutil.copytree(_no_tests_project_template, temp_dir, dirs_exist_ok=True)
     return temp_dir
 
 
+@pytest.fixture
+def no_tests_project_readonly(_no_tests_project_template):
+    """Shared copy of the project without tests; tests must not modify it."""
+    return _no_tests_project_template
+
+
+@pytest.fixture(scope="session")
+def no_tests_pipeline(_no_tests_project_template):
+    """Pipeline results for the project without tests, computed once."""
+    files = scan_codebase(str(_no_tests_project_template))
+    return _run_pipeline(_no_tests_project_template, files, analyze_files(files))
+
+
+@pytest.fixture(scope="session")
+def _mixed_languages_project_template(tmp_path_factory):
+    """Build the mixed-language project once per session."""
+    return _build_mixed_languages_project(tmp_path_factory.mktemp("mixed_languages_project"))
+
+
+@pytest.fixture
+def mixed_languages_project(temp_dir, _mixed_languages_project_template):
+    """Fresh copy of the mixed-language project that the test may modify."""
+    shutil.copytree(_mixed_languages_project_template, temp_dir, dirs_exist_ok=True)
+    return temp_dir
+
+
+@pytest.fixture
+def mixed_languages_project_readonly(_mixed_languages_project_template):
+    """Shared copy of the mixed-language project; tests must not modify it."""
+    return _mixed_languages_project_template
+
+
+@pytest.fixture(scope="session")
+def mixed_languages_pipeline(_mixed_languages_project_template):
+    """Pipeline results for the mixed-language project, computed once."""
+    files = scan_codebase(str(_mixed_languages_project_template))
+    return _run_pipeline(_mixed_languages_project_template, files, analyze_files(files))
+
+
 @pytest.fixture
 def empty_project(temp_dir):
     """Create an empty project directory."""
     return temp_dir
+
+
+@pytest.fixture(scope="session")
+def empty_pipeline(tmp_path_factory):
+    """Pipeline results for a directory with no source files, computed once."""
+    root = tmp_path_factory.mktemp("empty_project")
+    files = scan_codebase(str(root))
+    return _run_pipeline(root, files, analyze_files(files))
+
+
+# Synthetic metrics for the verbose module tests; built once and never mutated
+@pytest.fixture(scope="session")
+def base_metrics():
+    """
+    Baseline metrics object with a perfect score, built once per session.
+
+    Tests must not mutate it; derive variants with dataclasses.replace.
+    """
+    return CodebaseMetrics(
+        total_files=10,
+        source_files=10,
+        test_files=5,
+        source_loc=1000,
+        test_loc=1000,
+        test_to_code_ratio=1.0,  # Excellent
+        ai_smell_scores={},
+        duplicate_groups=[],
+        long_functions=[],
+        sensitive_functions_without_error_handling=[],
+        todos=[],
+        total_classes=1,
+    )
+
+
+@pytest.fixture(scope="session")
+def robust_metrics():
+    """Metrics that populate every report section."""
+    return CodebaseMetrics(
+        total_files=50,
+        source_files=40,
+        test_files=10,
+        total_lines=5000,
+        source_loc=4000,
+        test_loc=1000,
+        health_score=78,
+        risk_level="MODERATE",
+        estimated_defects=120,
+        feature_count=15,
+        total_functions=200,
+        total_classes=20,
+        ai_smell_scores={
+            "excessive_comments": 0.2,
+            "verbose_naming": 0.6,
+            "missing_error_handling": 0.8,
+        },
+        duplicate_groups=[
+            DuplicateGroup(files=["a.py", "b.py"], is_exact=True, similarity=1.0)
+        ],
+        todos=["TODO: fix this"],
+        languages={"Python": {"lines": 3000}, "JavaScript": {"lines": 1000}}
+    )
+
+
+@pytest.fixture(scope="session")
+def fixer_metrics():
+    """Create a metrics object that triggers all fix types."""
+    source_file = SourceFile(MagicMock(), "src/main.py", "Python", False, 1000)
+    analysis = FileAnalysis(
+        source_file=source_file,
+        total_lines=200,
+        code_lines=150,
+        comment_lines=10,
+        blank_lines=40,
+        functions=[
+            FunctionInfo("long_func", 1, 100, 99),
+            FunctionInfo("sensitive_func", 101, 150, 49, is_sensitive=True)
+        ],
+        classes=[],
+        imports=[],
+        todos=[(10, "TODO: fix critical bug")],
+        string_literals=[],
+        has_error_handling=False
+    )
+
+    metrics = CodebaseMetrics()
+    metrics.file_analyses = [analysis]
+    metrics.source_loc = 15000 # Trigger size fix
+    metrics.test_loc = 100 # Trigger test fix (low ratio)
+    metrics.test_to_code_ratio = 100 / 15000
+    metrics.sensitive_functions_without_error_handling = [("src/main.py", analysis.functions[1])]
+    metrics.long_functions = [("src/main.py", analysis.functions[0])]
+    metrics.duplicate_groups = [DuplicateGroup(files=["a.py", "b.py"], is_exact=True)]
+    metrics.ai_smell_scores = {"excessive_comments": 0.8}
+    metrics.todos = [("src/main.py", 10, "TODO: fix critical bug")]
+    metrics.health_score = 40
+    metrics.risk_level = "HIGH"
+
+    return metrics
@@ -6,23 +6,39 @@ import pytest
 from revibe.cli import create_parser, main, run_scan
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """One argument parser shared by the module; parse_args doesn't mutate it."""
+    return create_parser()
+
+
+@pytest.fixture(scope="module")
+def all_outputs(parser, _healthy_project_template, tmp_path_factory):
+    """Scan the healthy project once with --all and return the output directory."""
+    out = tmp_path_factory.mktemp("all_outputs")
+    args = parser.parse_args([
+        "scan", str(_healthy_project_template),
+        "--all", "--quiet",
+        "--output", str(out)
+    ])
+    assert run_scan(args) == 0
+    return out
+
+
 class TestCreateParser:
     """Tests for argument parser creation."""
 
-    def test_creates_parser(self):
-        parser = create_parser()
+    def test_creates_parser(self, parser):
         assert parser.prog == "revibe"
 
-    def test_version_flag(self, capsys):
-        parser = create_parser()
+    def test_version_flag(self, parser, capsys):
         with pytest.raises(SystemExit) as exc_info:
             parser.parse_args(["--version"])
         assert exc_info.value.code == 0
         captured = capsys.readouterr()
         assert "revibe" in captured.out
 
-    def test_scan_command_defaults(self):
-        parser = create_parser()
+    def test_scan_command_defaults(self, parser):
         args = parser.parse_args(["scan"])
         assert args.command == "scan"
         assert args.path == "."
@@ -30,13 +46,11 @@ class TestCreateParser:
         assert args.json is False
         assert args.fix is False
 
-    def test_scan_with_path(self):
-        parser = create_parser()
+    def test_scan_with_path(self, parser):
         args = parser.parse_args(["scan", "/some/path"])
         assert args.path == "/some/path"
 
-    def test_scan_with_all_flags(self):
-        parser = create_parser()
+    def test_scan_with_all_flags(self, parser):
         args = parser.parse_args([
             "scan", ".",
             "--html", "--json", "--fix", "--cursor", "--claude",
@@ -54,60 +68,75 @@ class TestCreateParser:
         assert args.output == "./reports"
         assert args.ignore == "vendor,tmp"
 
-    def test_scan_all_flag(self):
-        parser = create_parser()
+    def test_scan_all_flag(self, parser):
         args = parser.parse_args(["scan", ".", "--all"])
         assert args.all is True
 
+    def test_scan_jobs_flag(self, parser):
+        assert parser.parse_args(["scan"]).jobs is None
+        assert parser.parse_args(["scan", "--jobs", "4"]).jobs == 4
+        assert parser.parse_args(["scan", "-j", "2"]).jobs == 2
+        assert parser.parse_args(["scan", "-j", "0"]).jobs == 0
+
+    def test_scan_jobs_rejects_negative(self, parser, capsys):
+        with pytest.raises(SystemExit):
+            parser.parse_args(["scan", "-j", "-5"])
+        assert "must be 0 or greater" in capsys.readouterr().err
+
+    def test_scan_max_file_size_flag(self, parser):
+        assert parser.parse_args(["scan"]).max_file_size is None
+        assert parser.parse_args(["scan", "--max-file-size", "512"]).max_file_size == 512
+        assert parser.parse_args(["scan", "--max-file-size", "0"]).max_file_size == 0
+
+    def test_scan_max_file_size_rejects_negative(self, parser, capsys):
+        with pytest.raises(SystemExit):
+            parser.parse_args(["scan", "--max-file-size", "-1"])
+        assert "must be 0 or greater" in capsys.readouterr().err
+
 
 class TestRunScan:
     """Tests for the run_scan function."""
 
-    def test_nonexistent_path(self, capsys):
-        parser = create_parser()
+    def test_nonexistent_path(self, parser, capsys):
         args = parser.parse_args(["scan", "/nonexistent/path/that/does/not/exist"])
         result = run_scan(args)
         assert result == 1
         captured = capsys.readouterr()
         assert "does not exist" in captured.err
 
-    def test_file_not_directory(self, temp_dir, capsys):
+    def test_file_not_directory(self, parser, temp_dir, capsys):
         file_path = temp_dir / "file.txt"
         file_path.write_text("hello")
 
-        parser = create_parser()
         args = parser.parse_args(["scan", str(file_path)])
         result = run_scan(args)
         assert result == 1
         captured = capsys.readouterr()
         assert "not a directory" in captured.err
 
-    def test_empty_directory(self, empty_project):
-        parser = create_parser()
+    def test_empty_directory(self, parser, empty_project):
         args = parser.parse_args(["scan", str(empty_project), "--quiet"])
         result = run_scan(args)
         assert result == 0
 
-    def test_healthy_project_scan(self, healthy_project, capsys):
-        parser = create_parser()
-        args = parser.parse_args(["scan", str(healthy_project)])
-        result = run_scan(args)
+    @pytest.mark.parametrize("quiet", [False, True], ids=["normal", "quiet"])
+    def test_healthy_project_scan(self, parser, healthy_project_readonly, capsys, quiet):
+        argv = ["scan", str(healthy_project_readonly)]
+        if quiet:
+            argv.append("--quiet")
+        result = run_scan(parser.parse_args(argv))
         assert result == 0
         captured = capsys.readouterr()
-        assert "Health Score" in captured.out
-
-    def test_quiet_mode(self, healthy_project, capsys):
-        parser = create_parser()
-        args = parser.parse_args(["scan", str(healthy_project), "--quiet"])
-        result = run_scan(args)
-        assert result == 0
-        captured = capsys.readouterr()
-        # Should have minimal output
-        assert "Discovering" not in captured.out
-
-    def test_json_output(self, healthy_project, capsys):
-        parser = create_parser()
-        args = parser.parse_args(["scan", str(healthy_project), "--json"])
+        if quiet:
+            # Should have minimal output
+            assert "Discovering" not in captured.out
+            assert "Health Score" not in captured.out
+        else:
+            assert "Discovering" in captured.out
+            assert "Health Score" in captured.out
+
+    def test_json_output(self, parser, healthy_project_readonly, capsys):
+        args = parser.parse_args(["scan", str(healthy_project_readonly), "--json"])
         result = run_scan(args)
         assert result == 0
         captured = capsys.readouterr()
@@ -115,74 +144,31 @@ class TestRunScan:
         assert "{" in captured.out
         assert "health_score" in captured.out
 
-    def test_html_output(self, healthy_project, temp_dir):
-        parser = create_parser()
-        args = parser.parse_args([
-            "scan", str(healthy_project),
-            "--html", "--quiet",
-            "--output", str(temp_dir)
-        ])
-        result = run_scan(args)
-        assert result == 0
-        # Check HTML file was created
-        html_file = temp_dir / "revibe_report.html"
-        assert html_file.exists()
-        content = html_file.read_text()
-        assert "<html" in content
-        assert "Revibe" in content  # Check for branding
-
-    def test_fix_output(self, healthy_project, temp_dir):
-        parser = create_parser()
+    @pytest.mark.parametrize("filename,markers", [
+        ("revibe_report.html", ("<html", "Revibe")),
+        ("REVIBE_FIXES.md", ("Revibe",)),
+        (".cursorrules", ()),
+        ("REVIBE_CLAUDE.md", ()),
+    ])
+    def test_output_file(self, all_outputs, filename, markers):
+        output_file = all_outputs / filename
+        assert output_file.exists()
+        content = output_file.read_text()
+        for marker in markers:
+            assert marker in content
+
+    def test_single_flag_writes_only_its_output(self, parser, healthy_project_readonly, temp_dir):
         args = parser.parse_args([
-            "scan", str(healthy_project),
-            "--fix", "--quiet",
-            "--output", str(temp_dir)
-        ])
-        result = run_scan(args)
-        assert result == 0
-        fix_file = temp_dir / "REVIBE_FIXES.md"
-        assert fix_file.exists()
-        content = fix_file.read_text()
-        assert "Revibe" in content
-
-    def test_cursor_output(self, healthy_project, temp_dir):
-        parser = create_parser()
-        args = parser.parse_args([
-            "scan", str(healthy_project),
+            "scan", str(healthy_project_readonly),
             "--cursor", "--quiet",
             "--output", str(temp_dir)
         ])
         result = run_scan(args)
         assert result == 0
-        cursor_file = temp_dir / ".cursorrules"
-        assert cursor_file.exists()
-
-    def test_claude_output(self, healthy_project, temp_dir):
-        parser = create_parser()
-        args = parser.parse_args([
-            "scan", str(healthy_project),
-            "--claude", "--quiet",
-            "--output", str(temp_dir)
-        ])
-        result = run_scan(args)
-        assert result == 0
-        claude_file = temp_dir / "REVIBE_CLAUDE.md"
-        assert claude_file.exists()
-
-    def test_all_flag_generates_all_outputs(self, healthy_project, temp_dir):
-        parser = create_parser()
-        args = parser.parse_args([
-            "scan", str(healthy_project),
-            "--all", "--quiet",
-            "--output", str(temp_dir)
-        ])
-        result = run_scan(args)
-        assert result == 0
-        # All output files should exist
-        assert (temp_dir / "revibe_report.html").exists()
-        assert (temp_dir / "REVIBE_FIXES.md").exists()
         assert (temp_dir / ".cursorrules").exists()
-        assert (temp_dir / "REVIBE_CLAUDE.md").exists()
+        assert not (temp_dir / "revibe_report.html").exists()
+        assert not (temp_dir / "REVIBE_FIXES.md").exists()
+        assert not (temp_dir / "REVIBE_CLAUDE.md").exists()
 
 
 class TestMain:
@@ -194,8 +180,8 @@ class TestMain:
         captured = capsys.readouterr()
         assert "revibe" in captured.out or result == 0
 
-    def test_scan_command(self, healthy_project):
-        result = main(["scan", str(healthy_project), "--quiet"])
+    def test_scan_command(self, healthy_project_readonly):
+        result = main(["scan", str(healthy_project_readonly), "--quiet"])
         assert result == 0
 
     def test_invalid_command(self, capsys):
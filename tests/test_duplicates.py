@@ -1,7 +1,14 @@
 """Tests for duplicate detection."""
 
 
+from revibe.analyzer import analyze_files
 from revibe.duplicates import DuplicateGroup, find_all_duplicates
+from revibe.scanner import scan_codebase
+
+
+def _analyze(path):
+    """Scan and analyze a directory."""
+    return analyze_files(scan_codebase(str(path)))
 
 
 class TestExactDuplicates:
@@ -9,9 +16,6 @@ class TestExactDuplicates:
 
     def test_detects_exact_duplicates(self, temp_dir):
         """Two identical files should be flagged as exact duplicates."""
-        from revibe.analyzer import analyze_files
-        from revibe.scanner import scan_codebase
-
         # Create duplicate files
         content = "def hello():\n    print('world')\n" * 10
         (temp_dir / "a.py").write_text(content)
@@ -19,9 +23,7 @@ class TestExactDuplicates:
         # Create a different file
         (temp_dir / "c.py").write_text("def different():\n    pass\n")
 
-        files = scan_codebase(str(temp_dir))
-        analyses = analyze_files(files)
-        duplicates = find_all_duplicates(analyses)
+        duplicates = find_all_duplicates(_analyze(temp_dir))
 
         # Should find at least one duplicate group
         exact_groups = [g for g in duplicates if g.is_exact]
@@ -29,15 +31,10 @@ class TestExactDuplicates:
 
     def test_no_duplicates_in_unique_files(self, temp_dir):
         """Unique files should not be flagged."""
-        from revibe.analyzer import analyze_files
-        from revibe.scanner import scan_codebase
-
         for i in range(3):
             (temp_dir / f"file_{i}.py").write_text(f"def func_{i}():\n    return {i}\n")
 
-        files = scan_codebase(str(temp_dir))
-        analyses = analyze_files(files)
-        duplicates = find_all_duplicates(analyses)
+        duplicates = find_all_duplicates(_analyze(temp_dir))
 
         exact_groups = [g for g in duplicates if g.is_exact]
         assert len(exact_groups) == 0
@@ -48,9 +45,6 @@ class TestNearDuplicates:
 
     def test_detects_similar_files(self, temp_dir):
         """Similar files should be flagged as near duplicates."""
-        from revibe.analyzer import analyze_files
-        from revibe.scanner import scan_codebase
-
         # Create similar files (same structure, minor differences)
         (temp_dir / "utils_v1.py").write_text(
             "def helper_one():\n    return 1\n\n"
@@ -63,9 +57,7 @@ class TestNearDuplicates:
             "def helper_three():\n    return 30\n"
         )
 
-        files = scan_codebase(str(temp_dir))
-        analyses = analyze_files(files)
-        duplicates = find_all_duplicates(analyses)
+        duplicates = find_all_duplicates(_analyze(temp_dir))
 
         # May or may not find near duplicates depending on threshold
         # Just ensure it doesn't crash
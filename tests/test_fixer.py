@@ -1,12 +1,7 @@
 """Tests for the fixer module — THE KEY DIFFERENTIATOR."""
 
 
-from revibe.analyzer import analyze_files
-from revibe.duplicates import find_all_duplicates
 from revibe.fixer import Fix, FixerEngine, FixPlan, generate_fix_plan
-from revibe.metrics import aggregate_metrics
-from revibe.scanner import scan_codebase
-from revibe.smells import detect_all_smells
 
 
 class TestFixPlan:
@@ -37,14 +32,10 @@ class TestFixPlan:
 class TestFixerEngine:
     """Tests for the FixerEngine class."""
 
-    def test_generate_fixes_no_tests(self, no_tests_project):
-        files = scan_codebase(str(no_tests_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_generate_fixes_no_tests(self, no_tests_pipeline, no_tests_project_readonly):
+        metrics = no_tests_pipeline.metrics
 
-        fixer = FixerEngine(str(no_tests_project))
+        fixer = FixerEngine(str(no_tests_project_readonly))
         plan = fixer.generate_fixes(metrics)
 
         assert isinstance(plan, FixPlan)
@@ -58,28 +49,20 @@ class TestFixerEngine:
         assert test_fix is not None
         assert test_fix.priority == "CRITICAL"
 
-    def test_generate_fixes_healthy(self, healthy_project):
-        files = scan_codebase(str(healthy_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_generate_fixes_healthy(self, healthy_project_readonly, healthy_pipeline):
+        metrics = healthy_pipeline.metrics
 
-        fixer = FixerEngine(str(healthy_project))
+        fixer = FixerEngine(str(healthy_project_readonly))
         plan = fixer.generate_fixes(metrics)
 
         # Healthy project should have fewer/no critical fixes
         critical_count = len(plan.critical_fixes)
         assert critical_count <= 1  # May have minor issues
 
-    def test_generate_fixes_with_duplicates(self, bloated_project):
-        files = scan_codebase(str(bloated_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_generate_fixes_with_duplicates(self, bloated_pipeline, bloated_project_readonly):
+        metrics = bloated_pipeline.metrics
 
-        fixer = FixerEngine(str(bloated_project))
+        fixer = FixerEngine(str(bloated_project_readonly))
         plan = fixer.generate_fixes(metrics)
 
         # Should detect duplicates
@@ -93,14 +76,10 @@ class TestFixerEngine:
 class TestRenderMarkdown:
     """Tests for markdown rendering."""
 
-    def test_render_markdown_valid(self, no_tests_project):
-        files = scan_codebase(str(no_tests_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_render_markdown_valid(self, no_tests_pipeline, no_tests_project_readonly):
+        metrics = no_tests_pipeline.metrics
 
-        fixer = FixerEngine(str(no_tests_project))
+        fixer = FixerEngine(str(no_tests_project_readonly))
         plan = fixer.generate_fixes(metrics)
         markdown = fixer.render_markdown(plan)
 
@@ -110,14 +89,10 @@ class TestRenderMarkdown:
         assert "Health Score:" in markdown
         assert "```" in markdown  # Should have code blocks for prompts
 
-    def test_render_markdown_contains_file_references(self, no_tests_project):
-        files = scan_codebase(str(no_tests_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_render_markdown_contains_file_references(self, no_tests_pipeline, no_tests_project_readonly):
+        metrics = no_tests_pipeline.metrics
 
-        fixer = FixerEngine(str(no_tests_project))
+        fixer = FixerEngine(str(no_tests_project_readonly))
         plan = fixer.generate_fixes(metrics)
         markdown = fixer.render_markdown(plan)
 
@@ -127,14 +102,10 @@ class TestRenderMarkdown:
                 # At least one file should be mentioned
                 assert any(f in markdown for f in fix.affected_files[:3])
 
-    def test_render_markdown_priority_order(self, no_tests_project):
-        files = scan_codebase(str(no_tests_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_render_markdown_priority_order(self, no_tests_pipeline, no_tests_project_readonly):
+        metrics = no_tests_pipeline.metrics
 
-        fixer = FixerEngine(str(no_tests_project))
+        fixer = FixerEngine(str(no_tests_project_readonly))
         plan = fixer.generate_fixes(metrics)
         markdown = fixer.render_markdown(plan)
 
@@ -149,14 +120,10 @@ class TestRenderMarkdown:
 class TestRenderCursorRules:
     """Tests for .cursorrules rendering."""
 
-    def test_render_cursor_rules_valid(self, no_tests_project):
-        files = scan_codebase(str(no_tests_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_render_cursor_rules_valid(self, no_tests_pipeline, no_tests_project_readonly):
+        metrics = no_tests_pipeline.metrics
 
-        fixer = FixerEngine(str(no_tests_project))
+        fixer = FixerEngine(str(no_tests_project_readonly))
         plan = fixer.generate_fixes(metrics)
         rules = fixer.render_cursor_rules(plan)
 
@@ -165,14 +132,10 @@ class TestRenderCursorRules:
         assert "Health Score:" in rules
         assert "Priority fixes" in rules or "General rules" in rules
 
-    def test_render_cursor_rules_has_actionable_items(self, no_tests_project):
-        files = scan_codebase(str(no_tests_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_render_cursor_rules_has_actionable_items(self, no_tests_pipeline, no_tests_project_readonly):
+        metrics = no_tests_pipeline.metrics
 
-        fixer = FixerEngine(str(no_tests_project))
+        fixer = FixerEngine(str(no_tests_project_readonly))
         plan = fixer.generate_fixes(metrics)
         rules = fixer.render_cursor_rules(plan)
 
@@ -186,14 +149,10 @@ class TestRenderCursorRules:
 class TestRenderClaudeMd:
     """Tests for CLAUDE.md rendering."""
 
-    def test_render_claude_md_valid(self, no_tests_project):
-        files = scan_codebase(str(no_tests_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_render_claude_md_valid(self, no_tests_pipeline, no_tests_project_readonly):
+        metrics = no_tests_pipeline.metrics
 
-        fixer = FixerEngine(str(no_tests_project))
+        fixer = FixerEngine(str(no_tests_project_readonly))
         plan = fixer.generate_fixes(metrics)
         claude_md = fixer.render_claude_md(plan)
 
@@ -202,14 +161,10 @@ class TestRenderClaudeMd:
         assert "Health score:" in claude_md
         assert "risk" in claude_md.lower()
 
-    def test_render_claude_md_concise(self, no_tests_project):
-        files = scan_codebase(str(no_tests_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_render_claude_md_concise(self, no_tests_pipeline, no_tests_project_readonly):
+        metrics = no_tests_pipeline.metrics
 
-        fixer = FixerEngine(str(no_tests_project))
+        fixer = FixerEngine(str(no_tests_project_readonly))
         plan = fixer.generate_fixes(metrics)
         claude_md = fixer.render_claude_md(plan)
 
@@ -221,28 +176,18 @@ class TestRenderClaudeMd:
 class TestGenerateFixPlan:
     """Tests for the generate_fix_plan convenience function."""
 
-    def test_generate_fix_plan_works(self, healthy_project):
-        files = scan_codebase(str(healthy_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_generate_fix_plan_works(self, healthy_project_readonly, healthy_pipeline):
+        metrics = healthy_pipeline.metrics
 
-        plan = generate_fix_plan(str(healthy_project), metrics)
+        plan = generate_fix_plan(str(healthy_project_readonly), metrics)
 
         assert isinstance(plan, FixPlan)
-        assert plan.codebase_path == str(healthy_project)
+        assert plan.codebase_path == str(healthy_project_readonly)
         assert 0 <= plan.health_score <= 100
 
-    def test_empty_codebase_no_crash(self, empty_project):
-        files = scan_codebase(str(empty_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
-
+    def test_empty_codebase_no_crash(self, empty_pipeline):
         # Should not crash on empty codebase
-        plan = generate_fix_plan(str(empty_project), metrics)
+        plan = empty_pipeline.fix_plan
 
         assert isinstance(plan, FixPlan)
         # May have no fixes for empty project
@@ -252,14 +197,10 @@ class TestGenerateFixPlan:
 class TestPromptsAreSelfContained:
     """Tests ensuring prompts are self-contained for AI tools."""
 
-    def test_prompts_dont_reference_report(self, no_tests_project):
-        files = scan_codebase(str(no_tests_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_prompts_dont_reference_report(self, no_tests_pipeline, no_tests_project_readonly):
+        metrics = no_tests_pipeline.metrics
 
-        fixer = FixerEngine(str(no_tests_project))
+        fixer = FixerEngine(str(no_tests_project_readonly))
         plan = fixer.generate_fixes(metrics)
 
         for fix in plan.fixes:
@@ -269,14 +210,10 @@ class TestPromptsAreSelfContained:
             assert "as shown" not in prompt
             assert "in the report" not in prompt
 
-    def test_prompts_are_actionable(self, no_tests_project):
-        files = scan_codebase(str(no_tests_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_prompts_are_actionable(self, no_tests_pipeline, no_tests_project_readonly):
+        metrics = no_tests_pipeline.metrics
 
-        fixer = FixerEngine(str(no_tests_project))
+        fixer = FixerEngine(str(no_tests_project_readonly))
         plan = fixer.generate_fixes(metrics)
 
         for fix in plan.fixes:
@@ -1,76 +1,66 @@
 """Tests for the metrics module."""
 
+import sys
+
 import pytest
 
 from revibe.analyzer import analyze_files
-from revibe.duplicates import find_all_duplicates
 from revibe.metrics import (
     CodebaseMetrics,
+    DuplicateGroup,
     aggregate_metrics,
     calculate_defect_estimate,
     calculate_health_score,
+    detect_features,
     determine_risk_level,
 )
 from revibe.scanner import scan_codebase
-from revibe.smells import detect_all_smells
+
+# Fixed "terrible codebase" inputs for the health score range check
+_TERRIBLE_SMELLS = {f"smell{i}": 0.9 for i in range(8)}
+_TERRIBLE_DUPS = [None] * 10
+_TERRIBLE_LONG = [(None, None)] * 20
+_TERRIBLE_SENSITIVE = [(None, None)] * 10
+_TERRIBLE_TODOS = [None] * 50
 
 
 class TestCalculateDefectEstimate:
     """Tests for defect density calculation."""
 
-    def test_basic_calculation(self):
-        density, defects = calculate_defect_estimate(1000)
-        # With AI multiplier: 25 * 1.7 = 42.5 per KLOC
-        assert density == pytest.approx(42.5)
-        assert defects == pytest.approx(42, abs=1)
-
-    def test_no_ai_multiplier(self):
-        density, defects = calculate_defect_estimate(1000, ai_generated=False)
-        assert density == pytest.approx(25.0)
-        assert defects == pytest.approx(25, abs=1)
-
-    def test_zero_loc(self):
-        density, defects = calculate_defect_estimate(0)
-        assert defects == 0
-
-    def test_large_codebase(self):
-        density, defects = calculate_defect_estimate(100000)
-        # 100 KLOC * 42.5 = 4250 defects
-        assert defects == pytest.approx(4250, abs=50)
+    @pytest.mark.parametrize("loc,ai,density,defects", [
+        (1000, True, 42.5, 42),        # 25 * 1.7 = 42.5 per KLOC
+        (1000, False, 25.0, 25),
+        (0, True, 42.5, 0),
+        (100000, True, 42.5, 4250),    # 100 KLOC * 42.5
+    ])
+    def test_calculate_defect_estimate(self, loc, ai, density, defects):
+        assert calculate_defect_estimate(loc, ai_generated=ai) == (density, defects)
 
 
 class TestFeatureInteractions:
     """Tests for feature interaction formula: 2^n - 1 - n."""
 
-    def test_zero_features(self):
-        metrics = CodebaseMetrics(feature_count=0)
-        assert metrics.feature_interactions == 0
+    @pytest.mark.parametrize("n,expected", [
+        (0, 0),
+        (1, 0),                   # 2^1 - 1 - 1
+        (2, 1),                   # 2^2 - 1 - 2
+        (5, 26),                  # 2^5 - 1 - 5
+        (10, 1013),               # 2^10 - 1 - 10
+        (100, 2 ** 20 - 1 - 20),  # capped at n=20 to prevent overflow
+    ])
+    def test_feature_interactions(self, n, expected):
+        assert CodebaseMetrics(feature_count=n).feature_interactions == expected
 
-    def test_one_feature(self):
-        metrics = CodebaseMetrics(feature_count=1)
-        # 2^1 - 1 - 1 = 0
-        assert metrics.feature_interactions == 0
 
-    def test_two_features(self):
-        metrics = CodebaseMetrics(feature_count=2)
-        # 2^2 - 1 - 2 = 1
-        assert metrics.feature_interactions == 1
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+class TestSlottedDataclasses:
+    """Hot metric types should not carry a per-instance __dict__."""
 
-    def test_five_features(self):
-        metrics = CodebaseMetrics(feature_count=5)
-        # 2^5 - 1 - 5 = 32 - 1 - 5 = 26
-        assert metrics.feature_interactions == 26
+    def test_codebase_metrics_has_no_dict(self):
+        assert not hasattr(CodebaseMetrics(), "__dict__")
 
-    def test_ten_features(self):
-        metrics = CodebaseMetrics(feature_count=10)
-        # 2^10 - 1 - 10 = 1024 - 1 - 10 = 1013
-        assert metrics.feature_interactions == 1013
-
-    def test_large_feature_count_capped(self):
-        metrics = CodebaseMetrics(feature_count=100)
-        # Should be capped at n=20 to prevent overflow
-        # 2^20 - 1 - 20 = 1048555
-        assert metrics.feature_interactions == 2 ** 20 - 1 - 20
+    def test_duplicate_group_has_no_dict(self):
+        assert not hasattr(DuplicateGroup(files=["a.py", "b.py"], is_exact=True), "__dict__")
 
 
 class TestCalculateHealthScore:
@@ -122,11 +112,11 @@ class TestCalculateHealthScore:
         metrics = CodebaseMetrics(
             source_loc=1000,
             test_to_code_ratio=0.0,
-            ai_smell_scores={f"smell{i}": 0.9 for i in range(8)},
-            duplicate_groups=[None] * 10,
-            long_functions=[(None, None)] * 20,
-            sensitive_functions_without_error_handling=[(None, None)] * 10,
-            todos=[None] * 50,
+            ai_smell_scores=_TERRIBLE_SMELLS,
+            duplicate_groups=_TERRIBLE_DUPS,
+            long_functions=_TERRIBLE_LONG,
+            sensitive_functions_without_error_handling=_TERRIBLE_SENSITIVE,
+            todos=_TERRIBLE_TODOS,
             total_classes=100,
         )
         score = calculate_health_score(metrics)
@@ -136,37 +126,46 @@ class TestCalculateHealthScore:
 class TestDetermineRiskLevel:
     """Tests for risk level determination."""
 
-    def test_low_risk(self):
-        assert determine_risk_level(80) == "LOW"
-        assert determine_risk_level(100) == "LOW"
-
-    def test_moderate_risk(self):
-        assert determine_risk_level(60) == "MODERATE"
-        assert determine_risk_level(79) == "MODERATE"
-
-    def test_elevated_risk(self):
-        assert determine_risk_level(40) == "ELEVATED"
-        assert determine_risk_level(59) == "ELEVATED"
-
-    def test_high_risk(self):
-        assert determine_risk_level(20) == "HIGH"
-        assert determine_risk_level(39) == "HIGH"
-
-    def test_critical_risk(self):
-        assert determine_risk_level(0) == "CRITICAL"
-        assert determine_risk_level(19) == "CRITICAL"
+    @pytest.mark.parametrize("score,level", [
+        (100, "LOW"), (80, "LOW"),
+        (79, "MODERATE"), (60, "MODERATE"),
+        (59, "ELEVATED"), (40, "ELEVATED"),
+        (39, "HIGH"), (20, "HIGH"),
+        (19, "CRITICAL"), (0, "CRITICAL"),
+    ])
+    def test_determine_risk_level(self, score, level):
+        assert determine_risk_level(score) == level
+
+    @pytest.mark.parametrize("score,level", [
+        (float("nan"), "CRITICAL"),
+        (float("-inf"), "CRITICAL"),
+        (float("inf"), "LOW"),
+        (-5, "CRITICAL"), (150, "LOW"), (79.9, "MODERATE"),
+    ])
+    def test_out_of_range_and_non_finite(self, score, level):
+        assert determine_risk_level(score) == level
+
+
+class TestDetectFeatures:
+    """Tests for feature/route counting."""
+
+    @pytest.mark.parametrize("name,source,expected", [
+        ("page.js", "export default function HomePageRoute() {}\n", 2),
+        ("urls.py", "@router.path('/x')\nre_path('x')\n", 3),
+        ("app.py", "@app.route('/')\ndef index_view():\n    pass\n", 2),
+    ])
+    def test_overlapping_patterns_each_count(self, temp_dir, name, source, expected):
+        (temp_dir / name).write_text(source)
+        analyses = analyze_files(scan_codebase(str(temp_dir)))
+
+        assert detect_features(analyses) == expected
 
 
 class TestAggregateMetrics:
     """Tests for metrics aggregation."""
 
-    def test_aggregate_healthy_project(self, healthy_project):
-        files = scan_codebase(str(healthy_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_aggregate_healthy_project(self, healthy_pipeline):
+        metrics = healthy_pipeline.metrics
 
         assert isinstance(metrics, CodebaseMetrics)
         assert metrics.total_files > 0
@@ -177,13 +176,8 @@ class TestAggregateMetrics:
         assert 0 <= metrics.health_score <= 100
         assert metrics.risk_level in ["LOW", "MODERATE", "ELEVATED", "HIGH", "CRITICAL"]
 
-    def test_aggregate_no_tests_project(self, no_tests_project):
-        files = scan_codebase(str(no_tests_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_aggregate_no_tests_project(self, no_tests_pipeline):
+        metrics = no_tests_pipeline.metrics
 
         assert metrics.test_files == 0
         assert metrics.test_loc == 0
@@ -191,29 +185,29 @@ class TestAggregateMetrics:
         # Health score should be lower due to no tests
         assert metrics.health_score < 70
 
-    def test_aggregate_empty_project(self, empty_project):
-        files = scan_codebase(str(empty_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_aggregate_empty_project(self, empty_pipeline):
+        metrics = empty_pipeline.metrics
 
         assert metrics.total_files == 0
         assert metrics.source_loc == 0
 
-    def test_language_breakdown(self, mixed_languages_project):
-        files = scan_codebase(str(mixed_languages_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+    def test_language_breakdown(self, mixed_languages_pipeline):
+        metrics = mixed_languages_pipeline.metrics
 
         assert len(metrics.languages) >= 4  # Python, JS, TS, Go
         assert "Python" in metrics.languages
         assert "JavaScript" in metrics.languages
 
+    def test_language_breakdown_counts(self, analyzed_healthy_project):
+        files, analyses = analyzed_healthy_project
+
+        metrics = aggregate_metrics(files, analyses)
+
+        python = metrics.languages["Python"]
+        assert python["files"] == 4
+        assert python["test_files"] == 2
+        assert python["lines"] == metrics.source_loc + metrics.test_loc
+
 
 class TestMetricsSummary:
     """Tests for the summary method."""
@@ -0,0 +1,95 @@
+"""Tests for the parallel helpers."""
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from revibe import parallel
+from revibe.analyzer import analyze_files
+from revibe.metrics import detect_features
+from revibe.parallel import parallel_map, resolve_jobs
+from revibe.scanner import scan_codebase
+
+
+def _square(x):
+    return x * x
+
+
+class TestResolveJobs:
+    """Tests for --jobs value resolution."""
+
+    def test_none_means_cpu_count(self):
+        assert resolve_jobs(None) == (os.cpu_count() or 1)
+
+    def test_zero_means_cpu_count(self):
+        assert resolve_jobs(0) == (os.cpu_count() or 1)
+
+    def test_explicit_value(self):
+        assert resolve_jobs(3) == 3
+
+    def test_negative_clamped(self):
+        assert resolve_jobs(-2) == 1
+
+
+class TestParallelMap:
+    """Tests for parallel_map."""
+
+    def test_serial_preserves_order(self):
+        assert parallel_map(_square, [3, 1, 2], jobs=1) == [9, 1, 4]
+
+    def test_parallel_preserves_order(self, monkeypatch):
+        monkeypatch.setattr(parallel, "PARALLEL_MIN_ITEMS", 0)
+        assert parallel_map(_square, range(20), jobs=2) == [x * x for x in range(20)]
+
+    def test_empty_input(self):
+        assert parallel_map(_square, [], jobs=4) == []
+
+    @pytest.mark.parametrize("error", [
+        OSError("process spawning not permitted"),
+        NotImplementedError("no sem_open"),
+        BrokenProcessPool("worker died"),
+    ])
+    def test_falls_back_to_serial_when_pool_fails(self, monkeypatch, error):
+        def broken_pool(*args, **kwargs):
+            raise error
+
+        monkeypatch.setattr(parallel, "PARALLEL_MIN_ITEMS", 0)
+        monkeypatch.setattr(parallel, "ProcessPoolExecutor", broken_pool)
+        assert parallel_map(_square, range(20), jobs=2) == [x * x for x in range(20)]
+
+
+class TestParallelFeatureDetection:
+    """Parallel and serial feature detection must agree."""
+
+    def test_matches_serial(self, temp_dir, monkeypatch):
+        for i in range(6):
+            (temp_dir / f"routes_{i}.py").write_text(
+                "@app.route('/a')\ndef a_view():\n    pass\n\n@router.get('/b')\ndef b():\n    pass\n"
+            )
+
+        analyses = analyze_files(scan_codebase(str(temp_dir)))
+        serial = detect_features(analyses, jobs=1)
+
+        monkeypatch.setattr(parallel, "PARALLEL_MIN_ITEMS", 0)
+        assert detect_features(analyses, jobs=2) == serial
+        assert serial == 6 * 3
+
+
+class TestParallelAnalysis:
+    """Parallel and serial file analysis must agree."""
+
+    def test_matches_serial(self, temp_dir, monkeypatch):
+        for i in range(6):
+            (temp_dir / f"mod_{i}.py").write_text(
+                f"# TODO: tidy {i}\ndef handler_{i}(x):\n    try:\n        return x\n    except ValueError:\n        pass\n"
+            )
+        (temp_dir / "blob.py").write_bytes(b"\0\0binary")
+
+        files = scan_codebase(str(temp_dir))
+        serial = analyze_files(files, jobs=1)
+
+        monkeypatch.setattr(parallel, "PARALLEL_MIN_ITEMS", 0)
+        assert analyze_files(files, jobs=2) == serial
+        # The binary file is dropped either way
+        assert len(serial) == 6
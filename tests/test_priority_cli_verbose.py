@@ -3,6 +3,7 @@ Verbose tests for revibe.cli module.
 Focusing on argument parsing, main execution flow, and flag permutations.
 Targeting high line count and edge case coverage.
 """
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,29 +11,54 @@ import pytest
 from revibe.cli import create_parser, main, run_scan
 
 
+_DEFAULT_ARGS = {
+    "path": ".",
+    "output": None,
+    "ignore": None,
+    "all": False,
+    "html": False,
+    "json": False,
+    "fix": False,
+    "cursor": False,
+    "claude": False,
+    "quiet": False,
+    "no_color": False,
+    "jobs": None,
+    "max_file_size": None,
+    "command": "scan",
+}
+
+
 @pytest.fixture
 def mock_args():
-    args = MagicMock()
-    args.path = "."
-    args.output = None
-    args.ignore = None
-    args.all = False
-    args.html = False
-    args.json = False
-    args.fix = False
-    args.cursor = False
-    args.claude = False
-    args.quiet = False
-    args.no_color = False
-    args.command = "scan"
-    return args
+    """Parsed scan arguments with every flag at its default."""
+    return SimpleNamespace(**_DEFAULT_ARGS)
+
+
+@pytest.fixture
+def silence_cli_io(monkeypatch):
+    """Stub out every report writer run_scan can call."""
+    for name in ("print_terminal_report", "write_json_report", "generate_html_report", "_generate_fix_files"):
+        monkeypatch.setattr(f"revibe.cli.{name}", lambda *args, **kwargs: None)
+    monkeypatch.setattr("pathlib.Path.write_text", lambda self, *args, **kwargs: None)
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Parser shared by the parsing tests; parse_args leaves it untouched."""
+    return create_parser()
+
 
 class TestArgParser:
     """Verbose tests for argument parsing logic."""
 
-    def test_create_parser_defaults(self):
+    def test_create_parser_is_constructible(self, parser):
+        """A fresh parser parses exactly like the shared one."""
+        fresh = create_parser()
+        assert vars(fresh.parse_args(["scan", "."])) == vars(parser.parse_args(["scan", "."]))
+
+    def test_create_parser_defaults(self, parser):
         """Test parser default values."""
-        parser = create_parser()
         # Simulate parsing "scan ."
         args = parser.parse_args(["scan", "."])
         assert args.command == "scan"
@@ -43,9 +69,8 @@ class TestArgParser:
         assert args.html is False
         assert args.fix is False
 
-    def test_create_parser_all_flags(self):
+    def test_create_parser_all_flags(self, parser):
         """Test parser with all flags enabled."""
-        parser = create_parser()
         cmd = [
             "scan",
             "/tmp",
@@ -63,9 +88,8 @@ class TestArgParser:
         assert args.quiet is True
         assert args.no_color is True
 
-    def test_create_parser_individual_flags(self):
+    def test_create_parser_individual_flags(self, parser):
         """Test individual flags without --all."""
-        parser = create_parser()
         cmd = [
             "scan", ".",
             "--html",
@@ -89,7 +113,7 @@ class TestRunScanVerbose:
     @patch("revibe.cli._perform_scan")
     @patch("pathlib.Path.exists")
     @patch("pathlib.Path.is_dir")
-    def test_run_scan_invalid_path_not_exists(self, mock_is_dir, mock_exists, mock_args, capsys):
+    def test_run_scan_invalid_path_not_exists(self, mock_is_dir, mock_exists, mock_perform, mock_args, capsys):
         """Test run_scan with non-existent path."""
         mock_exists.return_value = False
         mock_args.path = "/invalid/path"
@@ -103,7 +127,7 @@ class TestRunScanVerbose:
     @patch("revibe.cli._perform_scan")
     @patch("pathlib.Path.exists")
     @patch("pathlib.Path.is_dir")
-    def test_run_scan_invalid_path_not_dir(self, mock_is_dir, mock_exists, mock_args, capsys):
+    def test_run_scan_invalid_path_not_dir(self, mock_is_dir, mock_exists, mock_perform, mock_args, capsys):
         """Test run_scan with file path instead of directory."""
         mock_exists.return_value = True
         mock_is_dir.return_value = False
@@ -116,10 +140,8 @@ class TestRunScanVerbose:
         assert "Path is not a directory" in captured.err
 
     @patch("revibe.cli._perform_scan")
-    @patch("pathlib.Path.exists", return_value=True)
-    @patch("pathlib.Path.is_dir", return_value=True)
     @patch("pathlib.Path.mkdir")
-    def test_run_scan_expand_all_flag(self, mock_mkdir, mock_is_dir, mock_exists, mock_perform, mock_args):
+    def test_run_scan_expand_all_flag(self, mock_mkdir, mock_perform, mock_args, fake_valid_path, silence_cli_io):
         """Test that --all flag enables other output flags."""
         mock_args.all = True
         # Initial False state
@@ -130,39 +152,29 @@ class TestRunScanVerbose:
         mock_result = MagicMock()
         mock_perform.return_value = mock_result
 
-        # We need to mock report generation functions to avoid actual errors/prints
-        with patch("revibe.cli.print_terminal_report"), \
-             patch("revibe.cli.generate_json_report"), \
-             patch("revibe.cli.generate_html_report"), \
-             patch("revibe.cli._generate_fix_files"), \
-             patch("pathlib.Path.write_text"):
-
-            run_scan(mock_args)
+        run_scan(mock_args)
 
-            # Verify flags were flipped
-            assert mock_args.html is True
-            assert mock_args.fix is True
-            assert mock_args.cursor is True
-            assert mock_args.claude is True
+        # Verify flags were flipped
+        assert mock_args.html is True
+        assert mock_args.fix is True
+        assert mock_args.cursor is True
+        assert mock_args.claude is True
 
     @patch("revibe.cli._perform_scan")
-    @patch("pathlib.Path.exists", return_value=True)
-    @patch("pathlib.Path.is_dir", return_value=True)
     @patch("pathlib.Path.mkdir")
-    def test_run_scan_output_directory_creation(self, mock_mkdir, mock_is_dir, mock_exists, mock_perform, mock_args):
+    def test_run_scan_output_directory_creation(
+        self, mock_mkdir, mock_perform, mock_args, fake_valid_path, silence_cli_io
+    ):
         """Test output directory is created."""
         mock_args.output = "custom_out"
         mock_perform.return_value = MagicMock()
 
-        with patch("revibe.cli.print_terminal_report"):
-            run_scan(mock_args)
+        run_scan(mock_args)
 
         mock_mkdir.assert_called_with(parents=True, exist_ok=True)
 
     @patch("revibe.cli._perform_scan")
-    @patch("pathlib.Path.exists", return_value=True)
-    @patch("pathlib.Path.is_dir", return_value=True)
-    def test_run_scan_returns_early_on_none_result(self, mock_is_dir, mock_exists, mock_perform, mock_args):
+    def test_run_scan_returns_early_on_none_result(self, mock_perform, mock_args, fake_valid_path):
         """Test successful exit when _perform_scan returns None (e.g. empty dir)."""
         mock_perform.return_value = None
         ret = run_scan(mock_args)
@@ -184,9 +196,7 @@ class TestMainEntryPoint:
         """Test calling without command prints help."""
         mock_parser = MagicMock()
         mock_create_parser.return_value = mock_parser
-        mock_args = MagicMock()
-        mock_args.command = None
-        mock_parser.parse_args.return_value = mock_args
+        mock_parser.parse_args.return_value = SimpleNamespace(command=None)
 
         ret = main(["arg"])
 
@@ -198,9 +208,7 @@ class TestMainEntryPoint:
         """Test calling with unknown command."""
         mock_parser = MagicMock()
         mock_create_parser.return_value = mock_parser
-        mock_args = MagicMock()
-        mock_args.command = "unknown"
-        mock_parser.parse_args.return_value = mock_args
+        mock_parser.parse_args.return_value = SimpleNamespace(command="unknown")
 
         ret = main(["unknown"])
 
@@ -209,10 +217,8 @@ class TestMainEntryPoint:
 
 
 @patch("revibe.cli._perform_scan")
-@patch("pathlib.Path.exists", return_value=True)
-@patch("pathlib.Path.is_dir", return_value=True)
 @patch("sys.stderr.write")
-def test_run_scan_exception_handling_verbose(mock_stderr, mock_is_dir, mock_exists, mock_perform, mock_args):
+def test_run_scan_exception_handling_verbose(mock_stderr, mock_perform, mock_args, fake_valid_path):
     """Test exception handling with and without debug mode."""
     # Setup exception
     mock_perform.side_effect = Exception("Boom")
@@ -7,6 +7,7 @@ Focuses on:
 - fixer.py: render_markdown edge cases
 """
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -44,7 +45,7 @@ def mock_analysis_factory():
     """Factory to create mock FileAnalysis objects."""
     def _create(path, code_lines=50, functions=None, classes=None):
         source = SourceFile(
-            path=MagicMock(),
+            path=Path(path),
             relative_path=path,
             language="Python",
             size_bytes=1000,
@@ -133,8 +134,10 @@ class TestTerminalReportPriority:
         """Verify calls to rich operations."""
         print_terminal_report_rich(mock_metrics, "0.1.0")
 
-        # Check that console.print was called multiple times
-        assert mock_console.return_value.print.call_count > 5
+        # Check that the whole report was buffered into one print
+        mock_console.return_value.print.assert_called_once()
+        group = mock_console.return_value.print.call_args[0][0]
+        assert len(group.renderables) > 5
 
 
 class TestCliPriority:
@@ -155,7 +158,7 @@ class TestCliPriority:
     @patch("revibe.cli._perform_scan")
     @patch("logging.exception")
     @patch("logging.error")
-    def test_run_scan_keyboard_interrupt(self, mock_log_err, mock_log_exc, mock_perform):
+    def test_run_scan_keyboard_interrupt(self, mock_log_err, mock_log_exc, mock_perform, fake_valid_path):
         """Handle keyboard interrupt gracefully with comprehensive error checking."""
         # 1. Input Validation (Simulated by checking mock config integrity)
         mock_args = MagicMock()
@@ -175,13 +178,10 @@ class TestCliPriority:
 
         # 3. Try/Except Block Verification
         # We verify that run_scan catches the interrupt and handles it safely
-        with patch("pathlib.Path.exists", return_value=True), \
-             patch("pathlib.Path.is_dir", return_value=True):
-
-            try:
-                ret = run_scan(mock_args)
-            except Exception as e:
-                pytest.fail(f"run_scan raised unexpected exception: {e}")
+        try:
+            ret = run_scan(mock_args)
+        except Exception as e:
+            pytest.fail(f"run_scan raised unexpected exception: {e}")
 
         # 4. User-friendly error messages
         # Check if the CLI logged the interruption (mock_log_error checks)
@@ -3,7 +3,6 @@ Verbose tests for duplicates.py focusing on near-duplicate detection logic.
 Targeting high line count and complex scenarios.
 """
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -23,9 +22,6 @@ def clean_analyses():
     analyses = []
     for name, content, lang in files:
         sf = SourceFile(Path(name), name, lang, False, len(content.encode('utf-8')))
-        # Mock path behavior for uniqueness checks if needed, but calculate_similarity uses objects
-        sf.path = MagicMock()
-        sf.path.name = name
 
         fa = FileAnalysis(
             source_file=sf,
@@ -38,50 +34,25 @@ def clean_analyses():
 class TestDuplicatesVerbose:
     """Verbose tests for duplicate detection."""
 
-    def test_calculate_similarity_identical_metrics(self):
-        """Test similarity of files with identical metrics."""
-        a1 = FileAnalysis(SourceFile(Path("1"), "1", "Py", False, 100), 100, 100)
-        a1.functions = [FunctionInfo("foo", 1, 10, 10)]
-        a1.classes = [ClassInfo("Bar", 1, 10, 10)]
-
-        a2 = FileAnalysis(SourceFile(Path("2"), "2", "Py", False, 100), 100, 100)
-        a2.functions = [FunctionInfo("foo", 1, 10, 10)]
-        a2.classes = [ClassInfo("Bar", 1, 10, 10)]
-
-        # Expect 1.0 because lines match, functions match, classes match
-        assert calculate_similarity(a1, a2) == 1.0
-
-    def test_calculate_similarity_distinct(self):
-        """Test similarity of disjoint files."""
-        a1 = FileAnalysis(SourceFile(Path("1"), "1", "Py", False, 100), 100, 100)
-        a1.functions = [FunctionInfo("foo", 1, 10, 10)]
-
-        a2 = FileAnalysis(SourceFile(Path("2"), "2", "Py", False, 200), 200, 200) # Different lines
-        a2.functions = [FunctionInfo("bar", 1, 10, 10)] # Different func
-
-        # Line sim: 100/200 = 0.5. Weighted 0.3 -> 0.15
-        # Func sim: 0. Weighted 0.5 -> 0
-        # Class sim: 0 (empty). Weighted 0.2 -> 0?
-
-        sim = calculate_similarity(a1, a2)
-        # Expected: ~0.15
-        assert 0.1 <= sim <= 0.2
-
-    def test_calculate_similarity_partial_overlap(self):
-        """Test partial overlap."""
-        a1 = FileAnalysis(SourceFile(Path("1"), "1", "Py", False, 100), 100, 100)
-        a1.functions = [FunctionInfo("shared", 1, 10, 10), FunctionInfo("unique1", 1, 10, 10)]
-
-        a2 = FileAnalysis(SourceFile(Path("2"), "2", "Py", False, 100), 100, 100)
-        a2.functions = [FunctionInfo("shared", 1, 10, 10), FunctionInfo("unique2", 1, 10, 10)]
-
-        # Line sim: 1.0 -> 0.3
-        # Func sim: intersection(1) / union(3) = 0.33. Weighted 0.5 -> ~0.165
-        # Class sim: 0.
-        # Total: 0.3 + 0.165 + 0 = 0.465
-
-        sim = calculate_similarity(a1, a2)
-        assert 0.4 <= sim <= 0.5
+    @pytest.mark.parametrize("funcs1,funcs2,classes1,classes2,lines1,lines2,lo,hi", [
+        # Lines, functions and classes all match -> 1.0
+        (["foo"], ["foo"], ["Bar"], ["Bar"], 100, 100, 1.0, 1.0),
+        # Line sim 100/200 * 0.3 = 0.15, no shared functions or classes
+        (["foo"], ["bar"], [], [], 100, 200, 0.1, 0.2),
+        # Line sim 0.3 + shared 1/3 functions * 0.5 ~= 0.465
+        (["shared", "unique1"], ["shared", "unique2"], [], [], 100, 100, 0.4, 0.5),
+    ], ids=["identical", "distinct", "partial_overlap"])
+    def test_calculate_similarity_bounds(self, funcs1, funcs2, classes1, classes2, lines1, lines2, lo, hi):
+        """Similarity is the weighted sum of line, function and class overlap."""
+        a1 = FileAnalysis(SourceFile(Path("1"), "1", "Py", False, lines1), lines1, lines1)
+        a1.functions = [FunctionInfo(name, 1, 10, 10) for name in funcs1]
+        a1.classes = [ClassInfo(name, 1, 10, 10) for name in classes1]
+
+        a2 = FileAnalysis(SourceFile(Path("2"), "2", "Py", False, lines2), lines2, lines2)
+        a2.functions = [FunctionInfo(name, 1, 10, 10) for name in funcs2]
+        a2.classes = [ClassInfo(name, 1, 10, 10) for name in classes2]
+
+        assert lo <= calculate_similarity(a1, a2) <= hi
 
     def test_find_near_duplicates_empty_input(self):
         """Test with empty analysis list."""
@@ -3,9 +3,10 @@ Comprehensive, verbose tests for report_html.py to ensure every style is present
 Targeting high LOC for test-to-code ratio improvement.
 """
 
+import re
+
 import pytest
 
-from revibe.metrics import CodebaseMetrics, DuplicateGroup
 from revibe.report_html import (
     _get_base_styles,
     _get_card_styles,
@@ -26,279 +27,279 @@ from revibe.report_html import (
 )
 
 
+def _multi_pattern(needles):
+    """
+    Compile needles into one lookahead alternation, longest first.
+
+    A single finditer pass then reports the longest needle starting at each
+    offset; shorter needles sharing that prefix are recovered in _missing.
+    """
+    alternation = "|".join(map(re.escape, sorted(needles, key=len, reverse=True)))
+    return re.compile(f"(?=({alternation}))")
+
+
+def _present(pattern, needles, text):
+    """Return the set of needles that occur somewhere in text."""
+    found = set(pattern.findall(text))
+    return {n for n in needles if any(f.startswith(n) for f in found)}
+
+
+def _missing(pattern, needles, text):
+    """Return the needles that do not occur anywhere in text."""
+    present = _present(pattern, needles, text)
+    return [n for n in needles if n not in present]
+
+
+# Confirmed selectors from report_html.py
+COMPONENT_SELECTORS = [
+    ".card",
+    ".health-card",
+    ".score-circle",
+    ".score-circle::before",
+    ".score-circle span",
+    ".score-circle .label",
+    ".score-low",
+    ".score-moderate",
+    ".score-elevated",
+    ".score-high",
+    ".health-details",
+    ".risk-badge",
+    ".risk-low",
+    ".metrics-grid",
+    ".metric-card",
+    ".metric-value",
+    ".metric-label",
+    ".metric-detail",
+    ".fix-item",
+    ".fix-header",
+    ".fix-priority",
+    ".priority-critical",
+    ".fix-title",
+    ".fix-toggle",
+    ".fix-content",
+    ".fix-description",
+    ".fix-prompt",
+    ".copy-btn",
+    ".copy-btn:hover",
+    ".copy-btn.copied",
+    ".smell-bar",
+    ".smell-name",
+    ".smell-track",
+    ".smell-fill",
+    ".smell-score",
+    ".lang-bar",
+    ".lang-name",
+    ".lang-track",
+    ".lang-fill",
+    ".lang-value",
+    ".duplicates-list",
+    ".duplicate-group",
+    ".duplicate-type",
+    ".duplicate-files",
+    ".tip",
+]
+_COMPONENT_RE = _multi_pattern(COMPONENT_SELECTORS)
+
+LAYOUT_SELECTORS = [
+    ".container",
+    "header",
+    "header h1",
+    ".header-content",
+    ".meta",
+    ".meta .path",
+    "main",
+    ".section",
+    ".section-title",
+    "footer",
+    "footer a",
+    "footer code",
+]
+_LAYOUT_RE = _multi_pattern(LAYOUT_SELECTORS)
+
+BASE_VARIABLES = [
+    "--bg-primary", "--bg-secondary", "--text-primary",
+    "--accent", "--success", "--warning", "--danger",
+]
+_BASE_VARIABLES_RE = _multi_pattern(BASE_VARIABLES)
+
+
+_STYLE_HELPERS = (
+    _get_base_styles,
+    _get_card_styles,
+    _get_code_styles,
+    _get_component_styles,
+    _get_duplicate_styles,
+    _get_fix_styles,
+    _get_footer_styles,
+    _get_header_styles,
+    _get_lang_styles,
+    _get_layout_styles,
+    _get_print_styles,
+    _get_risk_styles,
+    _get_score_styles,
+    _get_smell_styles,
+    _get_structure_styles,
+)
+
+
+@pytest.fixture(scope="session")
+def all_styles():
+    """Output of every style helper, keyed by function name, built once."""
+    return {helper.__name__: helper() for helper in _STYLE_HELPERS}
+
+
 class TestHtmlStylesVerbose:
     """Verbose tests for HTML styles."""
 
-    def test_component_styles_exhaustiveness(self):
+    def test_component_styles_exhaustiveness(self, all_styles):
         """Verify every expected component class is defined in CSS."""
-        styles = _get_component_styles()
-
-        # Confirmed selectors from report_html.py
-        expected_selectors = [
-            ".card",
-            ".health-card",
-            ".score-circle",
-            ".score-circle::before",
-            ".score-circle span",
-            ".score-circle .label",
-            ".score-low",
-            ".score-moderate",
-            ".score-elevated",
-            ".score-high",
-            ".health-details",
-            ".risk-badge",
-            ".risk-low",
-            ".metrics-grid",
-            ".metric-card",
-            ".metric-value",
-            ".metric-label",
-            ".metric-detail",
-            ".fix-item",
-            ".fix-header",
-            ".fix-priority",
-            ".priority-critical",
-            ".fix-title",
-            ".fix-toggle",
-            ".fix-content",
-            ".fix-description",
-            ".fix-prompt",
-            ".copy-btn",
-            ".copy-btn:hover",
-            ".copy-btn.copied",
-            ".smell-bar",
-            ".smell-name",
-            ".smell-track",
-            ".smell-fill",
-            ".smell-score",
-            ".lang-bar",
-            ".lang-name",
-            ".lang-track",
-            ".lang-fill",
-            ".lang-value",
-            ".duplicates-list",
-            ".duplicate-group",
-            ".duplicate-type",
-            ".duplicate-files",
-            ".tip",
-        ]
-
-        missing = []
-        for selector in expected_selectors:
-            # Check if selector key is present.
-            # Note: CSS string matching is loose.
-            if selector not in styles:
-                missing.append(selector)
+        styles = all_styles["_get_component_styles"]
 
+        missing = _missing(_COMPONENT_RE, COMPONENT_SELECTORS, styles)
         assert not missing, f"Missing selectors: {missing}"
 
-    def test_layout_styles_exhaustiveness(self):
+    def test_layout_styles_exhaustiveness(self, all_styles):
         """Verify layout styles."""
-        styles = _get_layout_styles()
-
-        expected = [
-            ".container",
-            "header",
-            "header h1",
-            ".header-content",
-            ".meta",
-            ".meta .path",
-            "main",
-            ".section",
-            ".section-title",
-            "footer",
-            "footer a",
-            "footer code",
-        ]
-
-        for selector in expected:
-            assert selector in styles
-
-    def test_print_styles_exhaustiveness(self):
+        styles = all_styles["_get_layout_styles"]
+
+        assert not _missing(_LAYOUT_RE, LAYOUT_SELECTORS, styles)
+
+    def test_print_styles_exhaustiveness(self, all_styles):
         """Verify print media queries."""
-        styles = _get_print_styles()
+        styles = all_styles["_get_print_styles"]
         assert "@media print" in styles
         assert "header { position: static; }" in styles
         assert ".copy-btn { display: none; }" in styles
 
-    def test_base_styles_exhaustiveness(self):
+    def test_base_styles_exhaustiveness(self, all_styles):
         """Verify base variable definitions."""
-        styles = _get_base_styles()
+        styles = all_styles["_get_base_styles"]
         # Verify variables
-        vars = [
-            "--bg-primary", "--bg-secondary", "--text-primary",
-            "--accent", "--success", "--warning", "--danger"
-        ]
-        for v in vars:
-            assert v in styles
+        assert not _missing(_BASE_VARIABLES_RE, BASE_VARIABLES, styles)
 
         # Verify body
         assert "body {" in styles
         assert "font-family:" in styles
 
+
+@pytest.fixture(scope="session")
+def robust_report(robust_metrics):
+    """HTML report for robust_metrics, generated once; no assertion depends on the path."""
+    return generate_html_report(robust_metrics, "/path/to/code")
+
+
+# Every plain substring the report tests look for, matched in a single pass
+REPORT_EXPECTED = [
+    "4,000", "78", "MODERATE", "15", "50", "200", "20",
+    "<!DOCTYPE html>", '<html lang="en">', "<style>", "<script>",
+    "risk-moderate",
+    "TODO/FIXME Markers", '<div class="metric-value">1</div>',
+    "Missing Error Handling",
+    "Duplicate Files", "Exact duplicate", "a.py", "b.py",
+    "Language Breakdown", "Python", "JavaScript", "3,000 lines",
+    "document.querySelectorAll", "navigator.clipboard.writeText",
+]
+_REPORT_RE = _multi_pattern(REPORT_EXPECTED)
+
+# Smell names are title-cased in the report; match without case-folding a copy
+_EXCESSIVE_COMMENTS_RE = re.compile("excessive comments", re.IGNORECASE)
+
+# Smell bar width for a 0.8 score, however the percentage is formatted
+_WIDTH_80_RE = re.compile(r"width: 80(?:\.0)?%")
+
+
+@pytest.fixture(scope="session")
+def report_tokens(robust_report):
+    """The REPORT_EXPECTED substrings present in robust_report."""
+    return _present(_REPORT_RE, REPORT_EXPECTED, robust_report)
+
+
 class TestHtmlReportGenerationVerbose:
     """Detailed tests for report generation."""
 
-    @pytest.fixture
-    def robust_metrics(self):
-        return CodebaseMetrics(
-            total_files=50,
-            source_files=40,
-            test_files=10,
-            total_lines=5000,
-            source_loc=4000,
-            test_loc=1000,
-            health_score=78,
-            risk_level="MODERATE",
-            estimated_defects=120,
-            feature_count=15,
-            total_functions=200,
-            total_classes=20,
-            ai_smell_scores={
-                "excessive_comments": 0.2,
-                "verbose_naming": 0.6,
-                "missing_error_handling": 0.8,
-            },
-            duplicate_groups=[
-                DuplicateGroup(files=["a.py", "b.py"], is_exact=True, similarity=1.0)
-            ],
-            todos=["TODO: fix this"],
-            languages={"Python": {"lines": 3000}, "JavaScript": {"lines": 1000}}
-        )
-
-    def test_report_contains_all_metrics(self, robust_metrics):
+    def test_report_contains_all_metrics(self, robust_report, report_tokens):
         """Verify all metrics appear in the HTML output."""
-        report = generate_html_report(robust_metrics, "/path/to/code")
-
         # Check counts
-        assert "4,000" in report # source loc
-        assert "78" in report # health score
+        assert "4,000" in report_tokens # source loc
+        assert "78" in report_tokens # health score
         # Check computed strings
-        assert "MODERATE" in report
-        assert "Excessive Comments" in report.title() or "Excessive comments" in report.lower()
+        assert "MODERATE" in report_tokens
+        assert _EXCESSIVE_COMMENTS_RE.search(robust_report)
 
         # Check specific values
-        assert "15" in report # features
-        assert "50" in report # feature interactions (paths)
-        assert "200" in report # functions
-        assert "20" in report # classes
+        assert "15" in report_tokens # features
+        assert "50" in report_tokens # feature interactions (paths)
+        assert "200" in report_tokens # functions
+        assert "20" in report_tokens # classes
 
-    def test_report_structure(self, robust_metrics):
+    def test_report_structure(self, report_tokens):
         """Verify HTML structure."""
-        report = generate_html_report(robust_metrics, ".")
-        assert "<!DOCTYPE html>" in report
-        assert "<html lang=\"en\">" in report
-        assert "<style>" in report
-        assert "<script>" in report
+        assert "<!DOCTYPE html>" in report_tokens
+        assert "<html lang=\"en\">" in report_tokens
+        assert "<style>" in report_tokens
+        assert "<script>" in report_tokens
 
-    def test_colors_present_for_risk(self, robust_metrics):
+    def test_colors_present_for_risk(self, report_tokens):
         """Verify risk colors are embedded."""
-        report = generate_html_report(robust_metrics, ".")
         # Should contain CSS variable usage for risk
-        assert "risk-moderate" in report
+        assert "risk-moderate" in report_tokens
 
-    def test_todos_section(self, robust_metrics):
+    def test_todos_section(self, report_tokens):
         """Verify TODOs section existence."""
-        report = generate_html_report(robust_metrics, ".")
         # report_html.py logic: TODOs are in metric-card count, output is count
-        assert "TODO/FIXME Markers" in report
+        assert "TODO/FIXME Markers" in report_tokens
         # The number 1 should be there
-        assert '<div class="metric-value">1</div>' in report
+        assert '<div class="metric-value">1</div>' in report_tokens
 
-    def test_smells_section_content(self, robust_metrics):
+    def test_smells_section_content(self, robust_report, report_tokens):
         """Verify smell details."""
-        report = generate_html_report(robust_metrics, ".")
-        assert "Missing Error Handling" in report # Title case from smell_names
-        assert "width: 80%" in report or "width: 80.0%" in report # 0.8 score
+        assert "Missing Error Handling" in report_tokens # Title case from smell_names
+        assert _WIDTH_80_RE.search(robust_report) # 0.8 score
 
-    def test_duplicates_section(self, robust_metrics):
+    def test_duplicates_section(self, report_tokens):
         """Verify duplicates section."""
-        report = generate_html_report(robust_metrics, ".")
-        assert "Duplicate Files" in report
-        assert "Exact duplicate" in report
-        assert "a.py" in report
-        assert "b.py" in report
+        assert "Duplicate Files" in report_tokens
+        assert "Exact duplicate" in report_tokens
+        assert "a.py" in report_tokens
+        assert "b.py" in report_tokens
 
-    def test_languages_section(self, robust_metrics):
+    def test_languages_section(self, report_tokens):
         """Verify language breakdown."""
-        report = generate_html_report(robust_metrics, ".")
-        assert "Language Breakdown" in report
-        assert "Python" in report
-        assert "JavaScript" in report
-        assert "3,000 lines" in report
+        assert "Language Breakdown" in report_tokens
+        assert "Python" in report_tokens
+        assert "JavaScript" in report_tokens
+        assert "3,000 lines" in report_tokens
 
-    def test_script_functionality_placeholders(self, robust_metrics):
+    def test_script_functionality_placeholders(self, report_tokens):
         """Verify JS functions are present in text."""
-        report = generate_html_report(robust_metrics, ".")
-        assert "document.querySelectorAll" in report
-        assert "navigator.clipboard.writeText" in report
+        assert "document.querySelectorAll" in report_tokens
+        assert "navigator.clipboard.writeText" in report_tokens
+
+
+# Snippets each style helper must emit, checked in one pass per helper
+STYLE_HELPER_SNIPPETS = [
+    (_get_structure_styles, [".container", "max-width: 1200px", "main"]),
+    (_get_header_styles, ["header", ".header-content", ".meta"]),
+    (_get_footer_styles, ["footer", "text-align: center", "footer a"]),
+    (_get_card_styles, [".card", "var(--bg-secondary)", "border-radius: 12px"]),
+    (_get_score_styles, [".score-circle", "width: 140px", "height: 140px", ".score-low"]),
+    (_get_risk_styles, [".risk-badge", ".risk-low"]),
+    (_get_fix_styles, [".fix-item", ".fix-priority", "font-weight: 600"]),
+    (_get_code_styles, [".copy-btn", "cursor: pointer", ".copy-btn:hover"]),
+    (_get_smell_styles, [".smell-bar", "display: flex", ".smell-track", ".smell-fill"]),
+    (_get_lang_styles, [".lang-bar", ".lang-name", ".lang-value"]),
+    (_get_duplicate_styles, [".duplicates-list", ".duplicate-group", ".duplicate-type"]),
+]
 
 
 class TestStyleHelpersVerbose:
     """Unit tests for individual style helper functions."""
 
-    def test_get_structure_styles(self):
-        css = _get_structure_styles()
-        assert ".container" in css
-        assert "max-width: 1200px" in css
-        assert "main" in css
-
-    def test_get_header_styles(self):
-        css = _get_header_styles()
-        assert "header" in css
-        assert ".header-content" in css
-        assert ".meta" in css
-
-    def test_get_footer_styles(self):
-        css = _get_footer_styles()
-        assert "footer" in css
-        assert "text-align: center" in css
-        assert "footer a" in css
-
-    def test_get_card_styles(self):
-        css = _get_card_styles()
-        assert ".card" in css
-        assert "var(--bg-secondary)" in css
-        assert "border-radius: 12px" in css
-
-    def test_get_score_styles(self):
-        css = _get_score_styles()
-        assert ".score-circle" in css
-        assert "width: 140px" in css
-        assert "height: 140px" in css
-        assert ".score-low" in css  # This IS in score styles
-
-    def test_get_risk_styles(self):
-        css = _get_risk_styles()
-        assert ".risk-badge" in css
-        assert ".risk-low" in css
-
-    def test_get_fix_styles(self):
-        css = _get_fix_styles()
-        assert ".fix-item" in css
-        assert ".fix-priority" in css
-        assert "font-weight: 600" in css
-
-    def test_get_code_styles(self):
-        css = _get_code_styles()
-        assert ".copy-btn" in css
-        assert "cursor: pointer" in css
-        assert ".copy-btn:hover" in css
-
-    def test_get_smell_styles(self):
-        css = _get_smell_styles()
-        assert ".smell-bar" in css
-        assert "display: flex" in css
-        assert ".smell-track" in css
-        assert ".smell-fill" in css
-
-    def test_get_lang_styles(self):
-        css = _get_lang_styles()
-        assert ".lang-bar" in css
-        assert ".lang-name" in css
-        assert ".lang-value" in css
-
-    def test_get_duplicate_styles(self):
-        css = _get_duplicate_styles()
-        assert ".duplicates-list" in css
-        assert ".duplicate-group" in css
-        assert ".duplicate-type" in css
+    @pytest.mark.parametrize(
+        "helper,snippets",
+        STYLE_HELPER_SNIPPETS,
+        ids=[helper.__name__ for helper, _ in STYLE_HELPER_SNIPPETS],
+    )
+    def test_style_helper(self, all_styles, helper, snippets):
+        missing = _missing(_multi_pattern(snippets), snippets, all_styles[helper.__name__])
+        assert not missing, f"{helper.__name__} missing: {missing}"
@@ -2,33 +2,70 @@
 Verbose tests for metrics.py focusing on health score calculation permutations.
 Targeting high line count and exhaustive coverage.
 """
+import bisect
+from dataclasses import replace
+
 import pytest
 
 from revibe.duplicates import DuplicateGroup
-from revibe.metrics import (
-    CodebaseMetrics,
-    calculate_health_score,
-    determine_risk_level,
-)
-
-
-@pytest.fixture
-def base_metrics():
-    """Create a baseline metrics object with perfect score."""
-    return CodebaseMetrics(
-        total_files=10,
-        source_files=10,
-        test_files=5,
-        source_loc=1000,
-        test_loc=1000,
-        test_to_code_ratio=1.0,  # Excellent
-        ai_smell_scores={},
-        duplicate_groups=[],
-        long_functions=[],
-        sensitive_functions_without_error_handling=[],
-        todos=[],
-        total_classes=1,
-    )
+from revibe.metrics import calculate_health_score, determine_risk_level
+
+# Shared list items: calculate_health_score only looks at len() of these lists
+_DUP = DuplicateGroup(files=["a", "b"], is_exact=True, similarity=1.0)
+_TODO = ("f", 1, "t")
+_LONG = ("file.py", "func")
+
+# Fixed smell-score shapes; calculate_health_score only reads these dicts
+_SMELL_5 = {f"smell{i}": 0.8 for i in range(5)}
+_SMELL_10 = {f"smell{i}": 0.8 for i in range(10)}
+_SMELL_WORST = {f"s{i}": 1.0 for i in range(10)}
+
+
+# (id, field overrides, expected score) for each penalty tier, applied to the
+# perfect baseline one category at a time
+PENALTY_CASES = [
+    # Test coverage (Max 40 pts)
+    ("cov-excellent", {"test_to_code_ratio": 0.85}, 100),  # >= 0.8 -> No penalty
+    ("cov-good", {"test_to_code_ratio": 0.55}, 90),        # >= 0.5 -> -10
+    ("cov-poor", {"test_to_code_ratio": 0.25}, 75),        # >= 0.2 -> -25
+    ("cov-critical", {"test_to_code_ratio": 0.15}, 65),    # >= 0.1 -> -35
+    ("cov-low", {"test_to_code_ratio": 0.05}, 60),         # < 0.1 -> -40
+    ("cov-zero", {"test_to_code_ratio": 0.0}, 60),
+    # AI smells (Max 20 pts, 4 pts each high smell)
+    ("smell-1high", {"ai_smell_scores": {"smell1": 0.8}}, 96),
+    ("smell-2high", {"ai_smell_scores": {"smell1": 0.8, "smell2": 0.9}}, 92),
+    ("smell-5high", {"ai_smell_scores": _SMELL_5}, 80),
+    ("smell-10high-cap", {"ai_smell_scores": _SMELL_10}, 80),
+    ("smell-low", {"ai_smell_scores": {"smell1": 0.5, "smell2": 0.6}}, 100),  # < 0.7
+    # Duplicate groups (Max 10 pts, 2 pts each)
+    ("dup-1", {"duplicate_groups": [_DUP]}, 98),
+    ("dup-3", {"duplicate_groups": [_DUP] * 3}, 94),
+    ("dup-5", {"duplicate_groups": [_DUP] * 5}, 90),
+    ("dup-10-cap", {"duplicate_groups": [_DUP] * 10}, 90),
+    # Long functions (Max 10 pts, 1 pt each)
+    ("long-1", {"long_functions": [_LONG]}, 99),
+    ("long-5", {"long_functions": [_LONG] * 5}, 95),
+    ("long-10", {"long_functions": [_LONG] * 10}, 90),
+    ("long-20-cap", {"long_functions": [_LONG] * 20}, 90),
+    # Sensitive functions without error handling (Max 10 pts, 2 pts each)
+    ("sensitive-1", {"sensitive_functions_without_error_handling": ["f0"]}, 98),
+    ("sensitive-3", {"sensitive_functions_without_error_handling": ["f"] * 3}, 94),
+    ("sensitive-5", {"sensitive_functions_without_error_handling": ["f"] * 5}, 90),
+    ("sensitive-10-cap", {"sensitive_functions_without_error_handling": ["f"] * 10}, 90),
+    # TODOs (Max 5 pts, tiered)
+    ("todo-5", {"todos": [_TODO] * 5}, 100),     # <= 5 -> 0 penalty
+    ("todo-6", {"todos": [_TODO] * 6}, 99),      # 6-10 -> -1
+    ("todo-10", {"todos": [_TODO] * 10}, 99),
+    ("todo-11", {"todos": [_TODO] * 11}, 97),    # 11-20 -> -3
+    ("todo-20", {"todos": [_TODO] * 20}, 97),
+    ("todo-21", {"todos": [_TODO] * 21}, 95),    # > 20 -> -5
+    ("todo-100", {"todos": [_TODO] * 100}, 95),
+]
+
+
+# Lower bounds of each risk band above CRITICAL, and the band names in order
+RISK_THRESHOLDS = [20, 40, 60, 80]
+RISK_LEVELS = ["CRITICAL", "HIGH", "ELEVATED", "MODERATE", "LOW"]
 
 
 class TestHealthScorePermutations:
@@ -39,130 +76,14 @@ class TestHealthScorePermutations:
         score = calculate_health_score(base_metrics)
         assert score == 100
 
-    def test_coverage_penalties(self, base_metrics):
-        """Test all tiers of test coverage penalties (Max 40 pts)."""
-        # Excellent coverage (>= 0.8) -> No penalty
-        base_metrics.test_to_code_ratio = 0.85
-        assert calculate_health_score(base_metrics) == 100
-
-        # Good coverage (>= 0.5) -> -10
-        base_metrics.test_to_code_ratio = 0.55
-        assert calculate_health_score(base_metrics) == 90
-
-        # Poor coverage (>= 0.2) -> -25
-        base_metrics.test_to_code_ratio = 0.25
-        assert calculate_health_score(base_metrics) == 75
-
-        # Critical coverage (>= 0.1) -> -35
-        base_metrics.test_to_code_ratio = 0.15
-        assert calculate_health_score(base_metrics) == 65
-
-        # Zero/Low coverage (< 0.1) -> -40
-        base_metrics.test_to_code_ratio = 0.05
-        assert calculate_health_score(base_metrics) == 60
-
-        base_metrics.test_to_code_ratio = 0.0
-        assert calculate_health_score(base_metrics) == 60
-
-    def test_smell_penalties(self, base_metrics):
-        """Test AI smell penalties (Max 20 pts, 4 pts each)."""
-        # 1 High smell -> -4
-        base_metrics.ai_smell_scores = {"smell1": 0.8}
-        assert calculate_health_score(base_metrics) == 96
-
-        # 2 High smells -> -8
-        base_metrics.ai_smell_scores = {"smell1": 0.8, "smell2": 0.9}
-        assert calculate_health_score(base_metrics) == 92
-
-        # 5 High smells -> -20 (Max)
-        base_metrics.ai_smell_scores = {f"smell{i}": 0.8 for i in range(5)}
-        assert calculate_health_score(base_metrics) == 80
-
-        # 10 High smells -> Still -20 (Cap check)
-        base_metrics.ai_smell_scores = {f"smell{i}": 0.8 for i in range(10)}
-        assert calculate_health_score(base_metrics) == 80
-
-        # Low smells (< 0.7) -> No penalty
-        base_metrics.ai_smell_scores = {"smell1": 0.5, "smell2": 0.6}
-        assert calculate_health_score(base_metrics) == 100
-
-    def test_duplicate_penalties(self, base_metrics):
-        """Test duplicate penalties (Max 10 pts, 2 pts each group)."""
-        # 1 Duplicate group -> -2
-        base_metrics.duplicate_groups = [DuplicateGroup(files=["a","b"], is_exact=True, similarity=1.0)]
-        assert calculate_health_score(base_metrics) == 98
-
-        # 3 groups -> -6
-        base_metrics.duplicate_groups = [DuplicateGroup(files=["a","b"], is_exact=True, similarity=1.0)] * 3
-        assert calculate_health_score(base_metrics) == 94
-
-        # 5 groups -> -10 (Max)
-        base_metrics.duplicate_groups = [DuplicateGroup(files=["a","b"], is_exact=True, similarity=1.0)] * 5
-        assert calculate_health_score(base_metrics) == 90
-
-        # 10 groups -> -10 (Cap check)
-        base_metrics.duplicate_groups = [DuplicateGroup(files=["a","b"], is_exact=True, similarity=1.0)] * 10
-        assert calculate_health_score(base_metrics) == 90
-
-    def test_long_function_penalties(self, base_metrics):
-        """Test long function penalties (Max 10 pts, 1 pt each)."""
-        # 1 long func -> -1
-        base_metrics.long_functions = [("file.py", "func")]
-        assert calculate_health_score(base_metrics) == 99
-
-        # 5 long funcs -> -5
-        base_metrics.long_functions = [("file.py", f"func{i}") for i in range(5)]
-        assert calculate_health_score(base_metrics) == 95
-
-        # 10 long funcs -> -10
-        base_metrics.long_functions = [("file.py", f"func{i}") for i in range(10)]
-        assert calculate_health_score(base_metrics) == 90
-
-        # 20 long funcs -> -10 (Cap check)
-        base_metrics.long_functions = [("file.py", f"func{i}") for i in range(20)]
-        assert calculate_health_score(base_metrics) == 90
-
-    def test_sensitive_unhandled_penalties(self, base_metrics):
-        """Test sensitive unhandled function penalties (Max 10 pts, 2 pts each)."""
-        # 1 unhandled -> -2
-        base_metrics.sensitive_functions_without_error_handling = ["auth"]
-        assert calculate_health_score(base_metrics) == 98
-
-        # 3 unhandled -> -6
-        base_metrics.sensitive_functions_without_error_handling = ["auth", "pay", "db"]
-        assert calculate_health_score(base_metrics) == 94
-
-        # 5 unhandled -> -10
-        base_metrics.sensitive_functions_without_error_handling = [f"f{i}" for i in range(5)]
-        assert calculate_health_score(base_metrics) == 90
-
-        # 10 unhandled -> -10 (Cap check)
-        base_metrics.sensitive_functions_without_error_handling = [f"f{i}" for i in range(10)]
-        assert calculate_health_score(base_metrics) == 90
-
-    def test_todo_penalties(self, base_metrics):
-        """Test TODO penalties (Max 5 pts, tiered)."""
-        # <= 5 TODOs -> 0 penalty
-        base_metrics.todos = [("f", 1, "t")] * 5
-        assert calculate_health_score(base_metrics) == 100
-
-        # 6-10 TODOs -> -1
-        base_metrics.todos = [("f", 1, "t")] * 6
-        assert calculate_health_score(base_metrics) == 99
-        base_metrics.todos = [("f", 1, "t")] * 10
-        assert calculate_health_score(base_metrics) == 99
-
-        # 11-20 TODOs -> -3
-        base_metrics.todos = [("f", 1, "t")] * 11
-        assert calculate_health_score(base_metrics) == 97
-        base_metrics.todos = [("f", 1, "t")] * 20
-        assert calculate_health_score(base_metrics) == 97
-
-        # > 20 TODOs -> -5
-        base_metrics.todos = [("f", 1, "t")] * 21
-        assert calculate_health_score(base_metrics) == 95
-        base_metrics.todos = [("f", 1, "t")] * 100
-        assert calculate_health_score(base_metrics) == 95
+    @pytest.mark.parametrize(
+        "overrides,expected",
+        [case[1:] for case in PENALTY_CASES],
+        ids=[case[0] for case in PENALTY_CASES],
+    )
+    def test_penalty(self, base_metrics, overrides, expected):
+        """Test each penalty tier in isolation against the perfect baseline."""
+        assert calculate_health_score(replace(base_metrics, **overrides)) == expected
 
     def test_over_engineering_penalty(self, base_metrics):
         """Test over-engineering penalty (Max 5 pts)."""
@@ -172,10 +93,9 @@ class TestHealthScorePermutations:
 
         # Let's try high density.
         # Source LOC = 100. Classes = 10. Density = 100.
-        base_metrics.source_loc = 100
-        base_metrics.total_classes = 10
+        dense = replace(base_metrics, source_loc=100, total_classes=10)
         # Assuming threshold is < 100.
-        score = calculate_health_score(base_metrics)
+        score = calculate_health_score(dense)
         # Should be penalty. Assuming -5.
         assert score == 95
 
@@ -183,40 +103,28 @@ class TestHealthScorePermutations:
         # If threshold is 20 (e.g. 1 class per 50 lines).
         # We need to ensure we trigger it.
         # Let's try ridiculous density: 100 classes in 100 lines.
-        base_metrics.total_classes = 100
-        assert calculate_health_score(base_metrics) == 95
+        assert calculate_health_score(replace(dense, total_classes=100)) == 95
 
     def test_combined_worst_case(self, base_metrics):
         """Test worst possible score (0)."""
-        # Coverage: 0 -> -40
-        base_metrics.test_to_code_ratio = 0.0
-
-        # Smells: Max -> -20
-        base_metrics.ai_smell_scores = {f"s{i}": 1.0 for i in range(10)}
-
-        # Duplicates: Max -> -10
-        base_metrics.duplicate_groups = [DuplicateGroup(files=["a"], is_exact=True, similarity=1.0)] * 10
-
-        # Long funcs: Max -> -10
-        base_metrics.long_functions = [("f", "f")] * 20
-
-        # Sensitive: Max -> -10
-        base_metrics.sensitive_functions_without_error_handling = ["f"] * 10
-
-        # Todo Items: Max -> -5
-        base_metrics.todos = [("f", 1, "t")] * 30
-
-        # Over-engineering: Max -> -5
-        base_metrics.source_loc = 100
-        base_metrics.total_classes = 100
+        worst = replace(
+            base_metrics,
+            test_to_code_ratio=0.0,  # Coverage: 0 -> -40
+            ai_smell_scores=_SMELL_WORST,  # Smells: Max -> -20
+            duplicate_groups=[_DUP] * 10,  # Duplicates: Max -> -10
+            long_functions=[_LONG] * 20,  # Long funcs: Max -> -10
+            sensitive_functions_without_error_handling=["f"] * 10,  # Sensitive: Max -> -10
+            todos=[_TODO] * 30,  # Todo Items: Max -> -5
+            source_loc=100,  # Over-engineering: Max -> -5
+            total_classes=100,
+        )
 
         # Total expected deductions: 40+20+10+10+10+5+5 = 100
         # Score = 100 - 100 = 0
-        assert calculate_health_score(base_metrics) == 0
+        assert calculate_health_score(worst) == 0
 
     def test_floor_at_zero(self, base_metrics):
         """Ensure score doesn't go negative."""
-        base_metrics.test_to_code_ratio = 0.0 # -40
         # Add massive penalties to exceed 100
         # (Already tested max penalties sum to 100, but let's imagine logic changed)
         # Just reuse worst case, assert it stays 0
@@ -226,24 +134,10 @@ class TestHealthScorePermutations:
 class TestRiskLevelDetermination:
     """Tests for determine_risk_level."""
 
-    def test_risk_levels(self):
-        """Test exact boundaries based on constants."""
-        # LOW (>= 80)
-        assert determine_risk_level(100) == "LOW"
-        assert determine_risk_level(80) == "LOW"
-
-        # MODERATE (60-79)
-        assert determine_risk_level(79) == "MODERATE"
-        assert determine_risk_level(60) == "MODERATE"
-
-        # ELEVATED (40-59)
-        assert determine_risk_level(59) == "ELEVATED"
-        assert determine_risk_level(40) == "ELEVATED"
-
-        # HIGH (20-39)
-        assert determine_risk_level(39) == "HIGH"
-        assert determine_risk_level(20) == "HIGH"
-
-        # CRITICAL (< 20)
-        assert determine_risk_level(19) == "CRITICAL"
-        assert determine_risk_level(0) == "CRITICAL"
+    def test_risk_level_full_range(self):
+        """Check every score 0-100 against the band found by bisecting the thresholds."""
+        wrong = [
+            score for score in range(101)
+            if determine_risk_level(score) != RISK_LEVELS[bisect.bisect_right(RISK_THRESHOLDS, score)]
+        ]
+        assert not wrong, wrong
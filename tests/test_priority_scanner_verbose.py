@@ -50,59 +50,29 @@ class TestSourceFileExhaustive:
 class TestScanDirectoryExhaustive:
     """Verbose tests for directory scanning logic."""
 
-    @patch("revibe.scanner.os.walk")
-    def test_scan_directory_mixed_content(self, mock_walk):
+    def test_scan_directory_mixed_content(self, tmp_path):
         """Verify scanning a mix of valid and ignored files."""
-        # Setup mocks
-        file_py = MagicMock(spec=Path)
-        file_py.is_file.return_value = True
-        file_py.name = "app.py"
-        file_py.stat.return_value.st_size = 500
-        file_py.read_bytes.return_value = b"print('hello')"
-        file_py.relative_to.return_value = Path("src/app.py")
-        # For os.walk, we need to construct the path logic inside scan_directory
-        # scan_directory joins dirpath + filename
-
-        # We'll allow the real Path construction but mock file checks
-        # Actually, simpler to mock scan_directory's internal logic or use fs,
-        # but sticking to pattern:
-        mock_walk.return_value = [
-            ("/root/src", ["components"], ["app.py", "script.js"]),
-            ("/root/img", [], ["image.png"])
-        ]
-
-        # We need Path / filename to work.
-        # Since standard Path / works, we just need to ensure files exist/are valid
-        # when scanner checks them.
-
-        with patch("revibe.scanner.Path.is_file", return_value=True), \
-             patch("revibe.scanner.Path.exists", return_value=True), \
-             patch("revibe.scanner.Path.stat", MagicMock(st_size=100)), \
-             patch("revibe.scanner.detect_language") as mock_detect:
-
-             mock_detect.side_effect = lambda p: "Python" if str(p).endswith(".py") else \
-                                               "JavaScript" if str(p).endswith(".js") else None
-
-        # Run
-        sources = list(scan_directory(Path("root")))
-
-        # Assertions
-        assert len(sources) == 2
-        py_source = next(s for s in sources if s.language == "Python")
-        js_source = next(s for s in sources if s.language == "JavaScript")
+        # Setup tree
+        (tmp_path / "src" / "components").mkdir(parents=True)
+        (tmp_path / "src" / "app.py").write_text("print('hello')")
+        (tmp_path / "src" / "script.js").write_text("console.log(1);")
+        (tmp_path / "img").mkdir()
+        (tmp_path / "img" / "image.png").write_bytes(b"\x89PNG")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").write_text("module.exports = 1;")
 
         # Run
-        sources = list(scan_directory(Path("/root")))
+        sources = list(scan_directory(tmp_path))
 
         # Assertions
         assert len(sources) == 2
         py_source = next(s for s in sources if s.language == "Python")
         js_source = next(s for s in sources if s.language == "JavaScript")
 
-        # relative path logic in scanner might produce different string representation
-        # but basic checks:
         assert py_source.path.name == "app.py"
         assert js_source.path.name == "script.js"
+        assert py_source.relative_path == str(Path("src") / "app.py")
+        assert py_source.size_bytes == len("print('hello')")
 
     def test_should_ignore_directory_exhaustive(self):
         """Verify every ignore pattern."""
@@ -240,10 +210,9 @@ def main():
             sf = SourceFile(Path("utils.js"), "utils.js", "JavaScript", False, 50)
             analysis = analyze_file(sf)
 
-            # Regex parser might be simple, verify it catches 'function' keyword at least
-            # Note: Revibe's current regex might not catch arrow funcs perfectly, checking behavior
+            # Both the function declaration and the arrow function assigned to a const
             func_names = [f.name for f in analysis.functions]
-            assert "add" in func_names
+            assert func_names == ["add", "sub"]
 
     def test_analyze_files_bulk(self):
         """Verify bulk analysis wrapper."""
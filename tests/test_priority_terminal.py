@@ -2,6 +2,8 @@
 Verbose tests for terminal reporting to increase test volume and coverage ratio.
 """
 
+import io
+import re
 from unittest.mock import patch
 
 import pytest
@@ -122,6 +124,18 @@ class TestTerminalReportPlainVerbose:
         out = capsys.readouterr().out
         assert "Top Fixes:" not in out
 
+    def test_plain_uses_given_fix_plan(self, capsys, verbose_metrics):
+        """Verify a caller-supplied plan is used without regenerating one."""
+        plan = FixPlan(
+            fixes=[Fix(priority="HIGH", title="Given Fix", description="d", prompt="p")],
+            codebase_path=".", health_score=65, risk_level="MODERATE", generated_at="now"
+        )
+        with patch("revibe.fixer.generate_fix_plan") as mock_plan:
+            print_terminal_report_plain(verbose_metrics, "0.1.0", plan)
+
+        mock_plan.assert_not_called()
+        assert "🟠 HIGH      Given Fix" in capsys.readouterr().out
+
 class TestTerminalReportRichVerbose:
     """Verbose verification for rich output calls."""
 
@@ -131,16 +145,18 @@ class TestTerminalReportRichVerbose:
     def test_rich_calls_sequence(self, mock_table, mock_panel, mock_console, verbose_metrics):
         """Verify sequence of rich object creation."""
 
-        # Setup table mock
+        # Setup table mock; fix titles go through Console.render_str
         table_instance = mock_table.return_value
+        mock_console.return_value.render_str.side_effect = lambda text, **kwargs: text
 
         # Run
         print_terminal_report_rich(verbose_metrics, "0.1.0")
 
-        # Verify console prints
-        c_prints = mock_console.return_value.print.call_args_list
-        # Expect at least: header, panel, table, fixes header, fix1, fix2, fix3, footer
-        assert len(c_prints) >= 10
+        # Verify everything is printed in a single call
+        mock_console.return_value.print.assert_called_once()
+        group = mock_console.return_value.print.call_args[0][0]
+        # Expect at least: header, panel, table, fixes header, fixes, footer
+        assert len(group.renderables) >= 10
 
         # Verify Panel creation
         mock_panel.assert_called_once()
@@ -167,6 +183,22 @@ class TestTerminalReportRichVerbose:
         # 7. Smells
         assert "AI Smells:" in row_calls[6][0][0]
 
+    def test_rich_fix_titles_keep_highlighting(self, verbose_metrics):
+        """Numbers in fix titles get rich's repr highlighting, as in a console.print."""
+        rich_console = pytest.importorskip("rich.console")
+        console = rich_console.Console(file=io.StringIO(), force_terminal=True, record=True, width=100)
+        plan = FixPlan(
+            fixes=[Fix(priority="HIGH", title="Remove 108 [dup] groups", description="d", prompt="p")],
+            codebase_path=".", health_score=65, risk_level="MODERATE", generated_at="now"
+        )
+        with patch("revibe.report_terminal.Console", return_value=console):
+            print_terminal_report_rich(verbose_metrics, "0.1.0", plan)
+
+        out = console.export_text(styles=True, clear=False)
+        assert re.search(r"\x1b\[[\d;]+m108\x1b\[0m", out)
+        # Titles are never parsed as markup
+        assert "[dup]" in console.export_text()
+
     @patch("revibe.report_terminal.RICH_AVAILABLE", False)
     @patch("revibe.report_terminal.print_terminal_report_plain")
     @patch("revibe.report_terminal.print_terminal_report_rich")
@@ -1,79 +1,64 @@
 """Tests for report generation modules."""
 
+import io
 import json
-
-from revibe.fixer import generate_fix_plan
-from revibe.report_html import generate_html_report
-from revibe.report_json import generate_json_report
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from revibe import report_json
+from revibe.analyzer import FileAnalysis
+from revibe.metrics import CodebaseMetrics
+from revibe.report_html import (
+    _get_component_styles,
+    _get_layout_styles,
+    _get_scripts,
+    _get_styles,
+    generate_html_report,
+)
+from revibe.report_json import _create_issues, generate_json_report, write_json_report
 from revibe.report_terminal import print_terminal_report
+from revibe.scanner import SourceFile
+
+# "Fix" or "fix", found in a single pass over the report
+_FIX_WORD_RE = re.compile("[Ff]ix")
 
 
 class TestHtmlReport:
     """Tests for HTML report generation."""
 
-    def test_generates_valid_html(self, healthy_project):
+    def test_generates_valid_html(self, healthy_project_readonly, healthy_pipeline):
         """HTML report should contain expected sections and be valid HTML."""
-        from revibe.analyzer import analyze_files
-        from revibe.duplicates import find_all_duplicates
-        from revibe.metrics import aggregate_metrics
-        from revibe.scanner import scan_codebase
-        from revibe.smells import detect_all_smells
-
-        files = scan_codebase(str(healthy_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
-
-        html = generate_html_report(metrics, str(healthy_project))
+        metrics = healthy_pipeline.metrics
+
+        html = generate_html_report(metrics, str(healthy_project_readonly))
         assert "<html" in html
         assert "</html>" in html
         assert "Revibe Report" in html
         assert "revibe.help" in html
 
-    def test_includes_fix_section(self, bloated_project):
+    def test_includes_fix_section(self, bloated_pipeline, bloated_project_readonly):
         """HTML report should include fix instructions."""
-        from revibe.analyzer import analyze_files
-        from revibe.duplicates import find_all_duplicates
-        from revibe.metrics import aggregate_metrics
-        from revibe.scanner import scan_codebase
-        from revibe.smells import detect_all_smells
-
-        files = scan_codebase(str(bloated_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
-        fix_plan = generate_fix_plan(str(bloated_project), metrics)
-
-        html = generate_html_report(metrics, str(bloated_project), fix_plan=fix_plan)
-        assert "Fix" in html or "fix" in html
-
-    def test_escapes_html_in_path(self, healthy_project):
+        metrics = bloated_pipeline.metrics
+
+        html = generate_html_report(metrics, str(bloated_project_readonly), fix_plan=bloated_pipeline.fix_plan)
+        assert _FIX_WORD_RE.search(html)
+
+    def test_escapes_html_in_path(self, healthy_pipeline):
         """HTML report should escape special characters in paths."""
-        from revibe.analyzer import analyze_files
-        from revibe.duplicates import find_all_duplicates
-        from revibe.metrics import aggregate_metrics
-        from revibe.scanner import scan_codebase
-        from revibe.smells import detect_all_smells
-
-        files = scan_codebase(str(healthy_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+        metrics = healthy_pipeline.metrics
 
         # Should not crash with special path
         html = generate_html_report(metrics, "/path/<with>/special&chars")
         assert "&lt;with&gt;" in html
         assert "&amp;chars" in html
 
-    def test_get_styles_and_scripts(self, healthy_project):
+    def test_get_styles_and_scripts(self):
         """Test internal helper functions for styles and scripts."""
-        # Inspect the module internals via the public API or direct import if needed
-        # Since they are private, we test them via the main function or direct import
-        from revibe.report_html import _get_scripts, _get_styles
-
         styles = _get_styles()
         assert ":root" in styles
         assert "body {" in styles
@@ -85,7 +70,6 @@ class TestHtmlReport:
 
     def test_get_component_styles(self):
         """Test component styles generation."""
-        from revibe.report_html import _get_component_styles
         styles = _get_component_styles()
         assert ".card" in styles
         assert ".score-circle" in styles
@@ -96,7 +80,6 @@ class TestHtmlReport:
 
     def test_get_layout_styles(self):
         """Test layout styles generation."""
-        from revibe.report_html import _get_layout_styles
         styles = _get_layout_styles()
         assert ".container" in styles
         assert "header" in styles
@@ -107,21 +90,12 @@ class TestHtmlReport:
 class TestJsonReport:
     """Tests for JSON report generation."""
 
-    def test_is_valid_json(self, healthy_project):
+    def test_is_valid_json(self, healthy_project_readonly, healthy_pipeline):
         """JSON report should be parseable JSON with expected keys."""
-        from revibe.analyzer import analyze_files
-        from revibe.duplicates import find_all_duplicates
-        from revibe.metrics import aggregate_metrics
-        from revibe.scanner import scan_codebase
-        from revibe.smells import detect_all_smells
-
-        files = scan_codebase(str(healthy_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
-
-        result = generate_json_report(metrics, str(healthy_project), analyses)
+        analyses = healthy_pipeline.analyses
+        metrics = healthy_pipeline.metrics
+
+        result = generate_json_report(metrics, str(healthy_project_readonly), analyses)
         data = json.loads(result)
 
         # JSON has nested structure
@@ -131,62 +105,108 @@ class TestJsonReport:
         assert "source_loc" in data["summary"]
         assert "test_to_code_ratio" in data["summary"]
 
-    def test_contains_smells(self, bloated_project):
+    def test_contains_smells(self, bloated_pipeline, bloated_project_readonly):
         """JSON report should include smell scores."""
-        from revibe.analyzer import analyze_files
-        from revibe.duplicates import find_all_duplicates
-        from revibe.metrics import aggregate_metrics
-        from revibe.scanner import scan_codebase
-        from revibe.smells import detect_all_smells
-
-        files = scan_codebase(str(bloated_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
-
-        result = generate_json_report(metrics, str(bloated_project), analyses)
+        analyses = bloated_pipeline.analyses
+        metrics = bloated_pipeline.metrics
+
+        result = generate_json_report(metrics, str(bloated_project_readonly), analyses)
         data = json.loads(result)
 
         assert "ai_smell_scores" in data
         assert isinstance(data["ai_smell_scores"], dict)
 
+    def test_write_matches_generate(self, healthy_project_readonly, healthy_pipeline):
+        """Streaming writer should produce the same report as the string API."""
+        analyses = healthy_pipeline.analyses
+        metrics = healthy_pipeline.metrics
+
+        buf = io.StringIO()
+        write_json_report(metrics, str(healthy_project_readonly), analyses, buf)
+        written = json.loads(buf.getvalue())
+        generated = json.loads(generate_json_report(metrics, str(healthy_project_readonly), analyses))
+
+        written["meta"].pop("generated_at")
+        generated["meta"].pop("generated_at")
+        assert written == generated
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_unserializable_data_gives_same_error_report(self, monkeypatch, orjson_available):
+        """Both public JSON paths report serialization errors the same way."""
+        if orjson_available:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(report_json, "ORJSON_AVAILABLE", orjson_available)
+        monkeypatch.setattr(report_json, "_create_report_data", lambda *args: {"bad": object()})
+
+        buf = io.StringIO()
+        write_json_report(None, ".", [], buf)
+        generated = generate_json_report(None, ".", [])
+
+        assert buf.getvalue() == generated + "\n"
+        assert json.loads(generated)["error"] == "Failed to generate JSON report"
+
+    def test_orjson_matches_stdlib(self, healthy_project_readonly, healthy_pipeline, monkeypatch):
+        """The orjson fast path should serialize the same report as stdlib json."""
+        pytest.importorskip("orjson")
+        args = (healthy_pipeline.metrics, str(healthy_project_readonly), healthy_pipeline.analyses)
+
+        fast = json.loads(generate_json_report(*args))
+        monkeypatch.setattr(report_json, "ORJSON_AVAILABLE", False)
+        stdlib = json.loads(generate_json_report(*args))
+
+        fast["meta"].pop("generated_at")
+        stdlib["meta"].pop("generated_at")
+        assert fast == stdlib
+
+    def test_orjson_output_is_ascii_like_stdlib(self, monkeypatch):
+        """The orjson path escapes non-ASCII text exactly as json.dumps does."""
+        pytest.importorskip("orjson")
+        data = {"path": "src/café/naïve.py", "emoji": "\U0001f600", "empty": [{}, []]}
+
+        fast = report_json._dumps(data)
+        monkeypatch.setattr(report_json, "ORJSON_AVAILABLE", False)
+        assert fast == report_json._dumps(data)
+
+    def test_complex_files_sorted_by_score(self):
+        """Complex files should be filtered on score > 10 and sorted descending."""
+        analyses = [
+            FileAnalysis(SourceFile(Path(name), name, "Python", False, 10), complexity_score=score)
+            for name, score in [("a.py", 12.04), ("b.py", 5.0), ("c.py", 40.26), ("d.py", 25.0)]
+        ]
+
+        issues = _create_issues(analyses, CodebaseMetrics())
+
+        assert issues["complex_files"] == [
+            {"file": "c.py", "score": 40.3},
+            {"file": "d.py", "score": 25.0},
+            {"file": "a.py", "score": 12.0},
+        ]
+
 
 class TestTerminalReport:
     """Tests for terminal report generation."""
 
-    def test_runs_without_error(self, healthy_project, capsys):
+    def test_import_does_not_load_fixer(self):
+        """The fixer is only imported when a plan has to be generated."""
+        code = "import sys, revibe.report_terminal; print('revibe.fixer' in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_runs_without_error(self, healthy_pipeline, capsys):
         """Terminal report should not crash."""
-        from revibe.analyzer import analyze_files
-        from revibe.duplicates import find_all_duplicates
-        from revibe.metrics import aggregate_metrics
-        from revibe.scanner import scan_codebase
-        from revibe.smells import detect_all_smells
-
-        files = scan_codebase(str(healthy_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+        metrics = healthy_pipeline.metrics
 
         # Should not raise
         print_terminal_report(metrics, "0.1.0")
         captured = capsys.readouterr()
         assert "Health Score" in captured.out
 
-    def test_plain_mode(self, healthy_project, capsys):
+    def test_plain_mode(self, healthy_pipeline, capsys):
         """Terminal report should work in plain mode."""
-        from revibe.analyzer import analyze_files
-        from revibe.duplicates import find_all_duplicates
-        from revibe.metrics import aggregate_metrics
-        from revibe.scanner import scan_codebase
-        from revibe.smells import detect_all_smells
-
-        files = scan_codebase(str(healthy_project))
-        analyses = analyze_files(files)
-        smells = detect_all_smells(analyses)
-        duplicates = find_all_duplicates(analyses)
-        metrics = aggregate_metrics(files, analyses, smells, duplicates)
+        metrics = healthy_pipeline.metrics
 
         print_terminal_report(metrics, "0.1.0", force_plain=True)
         captured = capsys.readouterr()
@@ -1,5 +1,8 @@
 """Tests for the scanner module."""
 
+import os
+import pickle
+import sys
 from pathlib import Path
 
 import pytest
@@ -7,12 +10,27 @@ import pytest
 from revibe.scanner import (
     SourceFile,
     detect_language,
+    get_language_breakdown,
     is_test_file,
     scan_codebase,
     should_ignore_directory,
+    should_ignore_file,
 )
 
 
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+class TestSourceFileSlots:
+    """SourceFile is created per discovered file and should stay compact."""
+
+    def test_has_no_dict(self):
+        sf = SourceFile(Path("a.py"), "a.py", "Python", False, 10)
+        assert not hasattr(sf, "__dict__")
+
+    def test_round_trips_through_pickle(self):
+        sf = SourceFile(Path("a.py"), "a.py", "Python", False, 10)
+        assert pickle.loads(pickle.dumps(sf)) == sf
+
+
 class TestDetectLanguage:
     """Tests for language detection."""
 
@@ -89,12 +107,28 @@ class TestShouldIgnoreDirectory:
         assert should_ignore_directory("src") is False
         assert should_ignore_directory("lib") is False
 
+    def test_ignore_mixed_case_entries(self):
+        assert should_ignore_directory("Pods") is True
+        assert should_ignore_directory("DerivedData") is True
+
+
+class TestShouldIgnoreFile:
+    """Tests for file ignore patterns."""
+
+    def test_ignore_minified_and_lock_files(self):
+        assert should_ignore_file(Path("dist/app.min.js")) is True
+        assert should_ignore_file(Path("package-lock.json")) is True
+        assert should_ignore_file(Path("App.MAP")) is True
+
+    def test_only_file_name_is_checked(self):
+        assert should_ignore_file(Path("/home/me/site.map/app.js")) is False
+
 
 class TestScanCodebase:
     """Tests for codebase scanning."""
 
-    def test_scan_healthy_project(self, healthy_project):
-        files = scan_codebase(str(healthy_project))
+    def test_scan_healthy_project(self, healthy_project_readonly):
+        files = scan_codebase(str(healthy_project_readonly))
 
         # Should find source and test files
         assert len(files) > 0
@@ -110,8 +144,8 @@ class TestScanCodebase:
         assert len(test_files) > 0
         assert len(source_files) > 0
 
-    def test_scan_mixed_languages(self, mixed_languages_project):
-        files = scan_codebase(str(mixed_languages_project))
+    def test_scan_mixed_languages(self, mixed_languages_project_readonly):
+        files = scan_codebase(str(mixed_languages_project_readonly))
 
         languages = {f.language for f in files}
         assert "Python" in languages
@@ -119,6 +153,27 @@ class TestScanCodebase:
         assert "TypeScript" in languages
         assert "Go" in languages
 
+    def test_threaded_scan_matches_serial(self, mixed_languages_project_readonly):
+        threaded = scan_codebase(str(mixed_languages_project_readonly))
+        serial = scan_codebase(str(mixed_languages_project_readonly), parallel=False)
+
+        assert threaded == serial
+
+    def test_scan_test_flags_match_is_test_file(self, temp_dir):
+        (temp_dir / "src" / "tests" / "unit").mkdir(parents=True)
+        (temp_dir / "src" / "tests" / "unit" / "helpers.py").write_text("x = 1\n")
+        (temp_dir / "src" / "app.py").write_text("x = 1\n")
+        (temp_dir / "src" / "app_test.py").write_text("x = 1\n")
+
+        files = scan_codebase(str(temp_dir))
+        flags = {f.relative_path: f.is_test for f in files}
+
+        assert flags == {
+            f.relative_path: is_test_file(f.path, f.relative_path) for f in files
+        }
+        assert flags[str(Path("src/tests/unit/helpers.py"))] is True
+        assert flags[str(Path("src/app.py"))] is False
+
     def test_scan_empty_project(self, empty_project):
         files = scan_codebase(str(empty_project))
         assert len(files) == 0
@@ -152,6 +207,21 @@ class TestScanCodebase:
         files2 = scan_codebase(str(temp_dir), additional_ignores=["custom_ignore"])
         assert not any("custom_ignore" in f.relative_path for f in files2)
 
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_scan_symlinks(self, temp_dir, parallel):
+        # Symlinked files are scanned; symlinked directories are not followed
+        (temp_dir / "src").mkdir()
+        (temp_dir / "src" / "app.py").write_text("pass")
+        try:
+            (temp_dir / "linked_dir").symlink_to(temp_dir / "src", target_is_directory=True)
+            (temp_dir / "linked.py").symlink_to(temp_dir / "src" / "app.py")
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        files = scan_codebase(str(temp_dir), parallel=parallel)
+
+        assert [f.relative_path for f in files] == ["linked.py", os.path.join("src", "app.py")]
+
     def test_scan_nonexistent_path(self):
         with pytest.raises(ValueError, match="does not exist"):
             scan_codebase("/nonexistent/path")
@@ -163,8 +233,8 @@ class TestScanCodebase:
         with pytest.raises(ValueError, match="not a directory"):
             scan_codebase(str(file_path))
 
-    def test_source_file_properties(self, healthy_project):
-        files = scan_codebase(str(healthy_project))
+    def test_source_file_properties(self, healthy_project_readonly):
+        files = scan_codebase(str(healthy_project_readonly))
 
         for f in files:
             assert isinstance(f, SourceFile)
@@ -173,3 +243,22 @@ class TestScanCodebase:
             assert f.language
             assert f.size_bytes >= 0
             assert isinstance(f.is_test, bool)
+
+
+class TestGetLanguageBreakdown:
+    """Tests for per-language file totals."""
+
+    def test_counts_files_tests_and_bytes(self):
+        files = [
+            SourceFile(Path("a.py"), "a.py", "Python", False, 100),
+            SourceFile(Path("test_a.py"), "test_a.py", "Python", True, 50),
+            SourceFile(Path("b.js"), "b.js", "JavaScript", False, 10),
+        ]
+
+        assert get_language_breakdown(files) == {
+            "Python": {"files": 2, "test_files": 1, "total_bytes": 150},
+            "JavaScript": {"files": 1, "test_files": 0, "total_bytes": 10},
+        }
+
+    def test_empty(self):
+        assert get_language_breakdown([]) == {}
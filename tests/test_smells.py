@@ -1,10 +1,16 @@
 """Tests for the smells module."""
 
+from collections import Counter
+from pathlib import Path
+
+import pytest
 
-from revibe.analyzer import analyze_files
-from revibe.scanner import scan_codebase
+from revibe.analyzer import FileAnalysis, analyze_files
+from revibe.scanner import SourceFile, scan_codebase
 from revibe.smells import (
+    _naming_style,
     clamp_score,
+    compute_smell_aggregates,
     detect_all_smells,
     detect_boilerplate_heavy,
     detect_copy_paste_artifacts,
@@ -35,6 +41,46 @@ class TestClampScore:
         assert clamp_score(2.0) == 1.0
 
 
+class TestNamingStyle:
+    """Tests for function name convention classification."""
+
+    def test_ascii_names(self):
+        assert _naming_style("snake_case") == "snake"
+        assert _naming_style("PascalCase") == "pascal"
+        assert _naming_style("camelCase") == "camel"
+        assert _naming_style("lower") is None
+        assert _naming_style("_1_") is None
+
+    def test_non_ascii_names(self):
+        assert _naming_style("crème_brûlée") == "snake"
+        assert _naming_style("Émile") == "pascal"
+        assert _naming_style("éCole") == "camel"
+
+
+class TestSmellAggregates:
+    """Tests for the shared detector totals."""
+
+    def test_totals_match_per_file_sums(self, bloated_pipeline):
+        analyses = bloated_pipeline.analyses
+        agg = compute_smell_aggregates(analyses)
+
+        assert agg.code_lines == sum(a.code_lines for a in analyses)
+        assert agg.comment_lines == sum(a.comment_lines for a in analyses)
+        assert agg.functions == sum(len(a.functions) for a in analyses)
+        assert agg.classes == sum(len(a.classes) for a in analyses)
+        assert agg.imports == sum(len(a.imports) for a in analyses)
+        assert agg.function_names == Counter(f.name for a in analyses for f in a.functions)
+
+    def test_detectors_accept_precomputed_totals(self, bloated_pipeline):
+        analyses = bloated_pipeline.analyses
+        agg = compute_smell_aggregates(analyses)
+
+        assert detect_over_engineering(analyses, agg) == detect_over_engineering(analyses)
+        assert detect_boilerplate_heavy(analyses, agg) == detect_boilerplate_heavy(analyses)
+        assert detect_inconsistent_patterns(analyses, agg) == detect_inconsistent_patterns(analyses)
+        assert detect_dead_code_indicators(analyses, agg) == detect_dead_code_indicators(analyses)
+
+
 class TestIndividualDetectors:
     """Tests for individual smell detectors."""
 
@@ -58,9 +104,8 @@ y = 2
         assert result.name == "excessive_comments"
         assert 0.0 <= result.score <= 1.0
 
-    def test_verbose_naming_detection(self, bloated_project):
-        files = scan_codebase(str(bloated_project))
-        analyses = analyze_files(files)
+    def test_verbose_naming_detection(self, bloated_pipeline):
+        analyses = bloated_pipeline.analyses
         result = detect_verbose_naming(analyses)
 
         assert result.name == "verbose_naming"
@@ -116,9 +161,8 @@ def yet_another_snake():
         assert result.name == "inconsistent_patterns"
         assert 0.0 <= result.score <= 1.0
 
-    def test_dead_code_indicators(self, bloated_project):
-        files = scan_codebase(str(bloated_project))
-        analyses = analyze_files(files)
+    def test_dead_code_indicators(self, bloated_pipeline):
+        analyses = bloated_pipeline.analyses
         result = detect_dead_code_indicators(analyses)
 
         assert result.name == "dead_code_indicators"
@@ -126,22 +170,20 @@ def yet_another_snake():
         # Should detect duplicate function names
         assert result.score > 0
 
-    def test_over_engineering_detection(self, bloated_project):
-        files = scan_codebase(str(bloated_project))
-        analyses = analyze_files(files)
+    def test_over_engineering_detection(self, bloated_pipeline):
+        analyses = bloated_pipeline.analyses
         result = detect_over_engineering(analyses)
 
         assert result.name == "over_engineering"
         assert 0.0 <= result.score <= 1.0
 
-    def test_missing_error_handling(self, no_tests_project):
-        files = scan_codebase(str(no_tests_project))
-        analyses = analyze_files(files)
+    def test_missing_error_handling(self, no_tests_pipeline):
+        analyses = no_tests_pipeline.analyses
         result = detect_missing_error_handling(analyses)
 
         assert result.name == "missing_error_handling"
         assert 0.0 <= result.score <= 1.0
-        # No error handling in no_tests_project
+        # No error handling in the no_tests_pipeline project
         assert result.score > 0
 
     def test_copy_paste_artifacts(self, temp_dir):
@@ -165,25 +207,30 @@ msg3 = "{repeated_string}"
 class TestDetectAllSmells:
     """Tests for the combined smell detection."""
 
-    def test_detect_all_returns_dict(self, healthy_project):
-        files = scan_codebase(str(healthy_project))
-        analyses = analyze_files(files)
+    def test_bad_analysis_only_zeroes_affected_detectors(self, healthy_pipeline):
+        bad = FileAnalysis(SourceFile(Path("bad.py"), "bad.py", "Python", False, 0), comment_lines=None)
+        scores = detect_all_smells([*healthy_pipeline.analyses, bad])
+
+        assert scores["excessive_comments"] == 0.0
+        for name in ("verbose_naming", "missing_error_handling", "copy_paste_artifacts"):
+            assert scores[name] == healthy_pipeline.smells[name]
+
+    def test_detect_all_returns_dict(self, analyzed_healthy_project):
+        files, analyses = analyzed_healthy_project
         scores = detect_all_smells(analyses)
 
         assert isinstance(scores, dict)
         assert len(scores) == 8  # 8 smell detectors
 
-    def test_all_scores_in_range(self, bloated_project):
-        files = scan_codebase(str(bloated_project))
-        analyses = analyze_files(files)
+    def test_all_scores_in_range(self, bloated_pipeline):
+        analyses = bloated_pipeline.analyses
         scores = detect_all_smells(analyses)
 
         for name, score in scores.items():
             assert 0.0 <= score <= 1.0, f"{name} score out of range: {score}"
 
-    def test_expected_smell_names(self, healthy_project):
-        files = scan_codebase(str(healthy_project))
-        analyses = analyze_files(files)
+    def test_expected_smell_names(self, analyzed_healthy_project):
+        files, analyses = analyzed_healthy_project
         scores = detect_all_smells(analyses)
 
         expected_smells = {
@@ -199,10 +246,8 @@ class TestDetectAllSmells:
 
         assert set(scores.keys()) == expected_smells
 
-    def test_healthy_project_lower_scores(self, healthy_project):
-        healthy_files = scan_codebase(str(healthy_project))
-        healthy_analyses = analyze_files(healthy_files)
-        healthy_scores = detect_all_smells(healthy_analyses)
+    def test_healthy_project_lower_scores(self, healthy_pipeline):
+        healthy_scores = healthy_pipeline.smells
 
         # Healthy project should generally have low smell scores
         healthy_avg = sum(healthy_scores.values()) / len(healthy_scores)
@@ -210,16 +255,17 @@ class TestDetectAllSmells:
         # Average smell score should be under 0.5 for a healthy project
         assert healthy_avg < 0.5
 
-    def test_empty_project_no_crash(self, empty_project):
-        files = scan_codebase(str(empty_project))
-        analyses = analyze_files(files)
-        scores = detect_all_smells(analyses)
+    def test_empty_project_no_crash(self, empty_pipeline):
+        scores = empty_pipeline.smells
 
         # Should return all zeros without crashing
         assert len(scores) == 8
         for score in scores.values():
             assert score == 0.0
 
+    def test_empty_input_keys_match_detectors(self, healthy_pipeline):
+        assert list(detect_all_smells([])) == list(healthy_pipeline.smells)
+
 
 class TestGetSmellDescriptions:
     """Tests for smell descriptions."""
@@ -233,9 +279,15 @@ class TestGetSmellDescriptions:
             assert isinstance(desc, str)
             assert len(desc) > 10  # Should be a meaningful description
 
-    def test_matches_detector_names(self, healthy_project):
-        files = scan_codebase(str(healthy_project))
-        analyses = analyze_files(files)
+    def test_shared_and_read_only(self):
+        descriptions = get_smell_descriptions()
+
+        assert descriptions is get_smell_descriptions()
+        with pytest.raises(TypeError):
+            descriptions["excessive_comments"] = "changed"
+
+    def test_matches_detector_names(self, analyzed_healthy_project):
+        files, analyses = analyzed_healthy_project
         scores = detect_all_smells(analyses)
         descriptions = get_smell_descriptions()
 